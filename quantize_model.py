@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Script to export the Indonesian BERT sentiment model to ONNX with INT8 dynamic quantization.
+
+Requires optimum with onnxruntime (pip install "optimum[onnxruntime]"). Once the
+quantized model exists, IndonesianSentimentAnalyzer loads it instead of the PyTorch model.
+The model is written to models/indo-bert-int8 in the repo root, or to the directory
+named by EMAS_QUANTIZED_MODEL_DIR when that is set.
+"""
+
+from src.emas_scraper.sentiment_analyzer import BERT_MODEL_NAME, QUANTIZED_MODEL_DIR
+
+def main():
+    """Main function to export and quantize the sentiment model."""
+    try:
+        from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    except ImportError:
+        print("❌ optimum is not installed. Run: pip install \"optimum[onnxruntime]\"")
+        return False
+
+    print(f"📦 Exporting {BERT_MODEL_NAME} to ONNX...")
+    model = ORTModelForSequenceClassification.from_pretrained(BERT_MODEL_NAME, export=True)
+
+    print("🔧 Applying INT8 dynamic quantization...")
+    quantizer = ORTQuantizer.from_pretrained(model)
+    quantization_config = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+    quantizer.quantize(save_dir=QUANTIZED_MODEL_DIR, quantization_config=quantization_config)
+
+    print(f"✅ Quantized model saved to: {QUANTIZED_MODEL_DIR}")
+    return True
+
+if __name__ == "__main__":
+    main()
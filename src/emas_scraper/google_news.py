@@ -1,16 +1,28 @@
 from __future__ import annotations
 
-import html
 import json
 import logging
+import re
+import sys
+import xml.etree.ElementTree as ET
 from dataclasses import asdict, dataclass
-from typing import Iterable, List, Optional
-from urllib.parse import quote_plus, unquote
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from html import unescape
+from io import BytesIO
+from typing import Iterable, Iterator, List, Optional
+from urllib.parse import quote_plus, unquote, urlparse
 
 import requests
-from bs4 import BeautifulSoup
 from dateutil import parser as dateparser
+from requests.adapters import HTTPAdapter
 
+try:
+    from lxml import etree
+except ImportError:  # fall back to the stdlib parser
+    etree = None
+
+from ._compat import DATACLASS_SLOTS
 from .config import SearchConfig
 
 # Setup logging
@@ -18,7 +30,7 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class NewsItem:
     title: str
     url: str
@@ -26,21 +38,49 @@ class NewsItem:
     publication_date: Optional[str]  # ISO date
 
 
+@lru_cache(maxsize=128)
+def _build_search_url(query: str, google_news_base: str) -> str:
+    """Quote the query into the RSS search URL; memoized per query and base URL."""
+    return google_news_base.format(query=quote_plus(query))
+
+
 def build_search_url(cfg: SearchConfig) -> str:
     """Build Google News RSS search URL from configuration."""
-    q = quote_plus(cfg.query)
-    url = cfg.google_news_base.format(query=q)
+    url = _build_search_url(cfg.query, cfg.google_news_base)
     logger.info(f"Built search URL: {url}")
     return url
 
 
+# Seconds a fetched feed is served from the HTTP cache (requests-cache only)
+CACHE_EXPIRE_AFTER = 300
+
+
+@lru_cache(maxsize=None)
+def _get_session() -> requests.Session:
+    """Shared HTTP session so connections (and cached feeds) are reused across fetches."""
+    try:
+        import requests_cache
+    except ImportError:
+        session = requests.Session()
+    else:
+        # Persistent SQLite cache; repeated searches within the expiry skip the network
+        session = requests_cache.CachedSession(
+            "gnews_cache", backend="sqlite", expire_after=CACHE_EXPIRE_AFTER
+        )
+    
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 def fetch(url: str, user_agent: str, timeout: int) -> str:
     """Fetch content from URL with proper headers and error handling."""
     headers = {"User-Agent": user_agent}
     
     try:
         logger.info(f"Fetching URL: {url}")
-        resp = requests.get(url, headers=headers, timeout=timeout)
+        resp = _get_session().get(url, headers=headers, timeout=timeout)
         resp.raise_for_status()
         logger.info(f"Successfully fetched {len(resp.text)} characters")
         return resp.text
@@ -52,70 +92,166 @@ def fetch(url: str, user_agent: str, timeout: int) -> str:
         raise
 
 
+def _fast_unescape(text: str) -> str:
+    """Unescape HTML entities left in feed text; most titles have none to unescape."""
+    return unescape(text) if "&" in text else text
+
+
+def _parse_pub_date(text: str) -> Optional[str]:
+    """Parse an RSS pubDate into an ISO date string."""
+    try:
+        # RSS pubDate is RFC 822, which the stdlib parses without heuristics
+        return parsedate_to_datetime(text).date().isoformat()
+    except (TypeError, ValueError):
+        pass
+    
+    # Fuzzy parsing for feeds that stray from RFC 822
+    try:
+        dt = dateparser.parse(text, fuzzy=True)
+        if dt:
+            return dt.date().isoformat()
+    except Exception as e:
+        logger.warning(f"Failed to parse date '{text}': {e}")
+    return None
+
+
+# Field order shared by both item readers and _make_news_item
+ITEM_FIELDS = ("title", "link", "source", "pubDate")
+
+
+def _make_news_item(
+    title_text: Optional[str],
+    link_text: Optional[str],
+    source_text: Optional[str],
+    pub_date_text: Optional[str],
+) -> Optional[NewsItem]:
+    """Build a NewsItem from RSS <item> field texts; None if it lacks a title or URL."""
+    # Extract title
+    title = _fast_unescape((title_text or "").strip())
+    
+    # Extract URL
+    url = (link_text or "").strip()
+    
+    # Extract source (from source tag or try to extract from URL)
+    source = None
+    if source_text:
+        # Feeds repeat a handful of publishers; share one string per name
+        source = sys.intern(_fast_unescape(source_text.strip()))
+    elif url:
+        # Try to extract domain as source
+        try:
+            domain = urlparse(url).netloc
+            if domain:
+                source = sys.intern(domain.replace('www.', ''))
+        except Exception:
+            pass
+    
+    # Extract publication date
+    pub_date = None
+    if pub_date_text:
+        pub_date = _parse_pub_date(pub_date_text)
+    
+    # Only keep items with title and URL
+    if not (title and url):
+        return None
+    return NewsItem(title=title, url=url, source=source, publication_date=pub_date)
+
+
+# Feeds up to this size (Google News returns ~100 items) are read with regexes
+REGEX_FEED_MAX_CHARS = 1_000_000
+
+_ITEM_RE = re.compile(r"<item\b[^>]*>(.*?)</item>", re.DOTALL)
+_FIELD_RES = {
+    name: re.compile(rf"<{name}\b[^>]*>(.*?)</{name}>", re.DOTALL)
+    for name in ITEM_FIELDS
+}
+
+
+def _regex_fast_path_applies(xml_text: str) -> bool:
+    """True for small feeds the regex reader can handle without an XML parser."""
+    return (
+        len(xml_text) <= REGEX_FEED_MAX_CHARS
+        and "<item" in xml_text
+        and "<![CDATA[" not in xml_text
+    )
+
+
+def _iter_regex_items(xml_text: str) -> Iterator[tuple]:
+    """Yield the ITEM_FIELDS texts of each <item> with a single regex pass."""
+    for match in _ITEM_RE.finditer(xml_text):
+        body = match.group(1)
+        fields = []
+        for name in ITEM_FIELDS:
+            field = _FIELD_RES[name].search(body)
+            # Decode XML entities the way the parser would
+            fields.append(_fast_unescape(field.group(1)) if field else None)
+        yield tuple(fields)
+
+
+def _iter_rss_items(xml_text: str) -> Iterator[tuple]:
+    """Stream the ITEM_FIELDS texts of each RSS <item>, clearing parsed elements."""
+    source = BytesIO(xml_text.encode("utf-8"))
+    if etree is not None:
+        context = etree.iterparse(
+            source, events=("end",), tag="item", huge_tree=False, recover=True
+        )
+    else:
+        context = ET.iterparse(source, events=("end",))
+    
+    for _, item in context:
+        if item.tag != "item":
+            continue
+        yield tuple(item.findtext(name) for name in ITEM_FIELDS)
+        # Drop parsed items so memory stays bounded on large feeds
+        item.clear()
+        if etree is not None:
+            while item.getprevious() is not None:
+                del item.getparent()[0]
+
+
+def _collect_news_items(rss_items: Iterator[tuple], max_items: int) -> List[NewsItem]:
+    """Build NewsItems from item field tuples, stopping at max_items."""
+    items: List[NewsItem] = []
+    for fields in rss_items:
+        try:
+            news_item = _make_news_item(*fields)
+            if news_item:
+                items.append(news_item)
+        except Exception as e:
+            logger.warning(f"Failed to parse RSS item: {e}")
+        
+        # Stop reading the feed once enough items are collected
+        if len(items) >= max_items:
+            break
+    return items
+
+
 def parse_google_news_rss(xml_text: str, max_items: int = 50) -> List[NewsItem]:
     """Parse Google News RSS feed and extract news items."""
+    if _regex_fast_path_applies(xml_text):
+        try:
+            items = _collect_news_items(_iter_regex_items(xml_text), max_items)
+            if items:
+                logger.info(f"Successfully parsed {len(items)} news items")
+                return items
+        except Exception as e:
+            logger.debug(f"Regex RSS reader failed, using the XML parser: {e}")
+    
+    rss_items = _iter_rss_items(xml_text)
     try:
-        soup = BeautifulSoup(xml_text, "xml")
-        items = []
-        
-        rss_items = soup.find_all("item")
-        logger.info(f"Found {len(rss_items)} RSS items, processing up to {max_items}")
-        
-        for item in rss_items[:max_items]:
-            try:
-                # Extract title
-                title = item.title.text.strip() if item.title else ""
-                title = html.unescape(title)
-                
-                # Extract URL
-                link_tag = item.link
-                url = link_tag.text.strip() if link_tag else ""
-                
-                # Extract source (from source tag or try to extract from URL)
-                source = None
-                source_tag = item.find("source")
-                if source_tag and source_tag.text:
-                    source = source_tag.text.strip()
-                elif url:
-                    # Try to extract domain as source
-                    try:
-                        from urllib.parse import urlparse
-                        domain = urlparse(url).netloc
-                        if domain:
-                            source = domain.replace('www.', '')
-                    except Exception:
-                        pass
-                
-                # Extract publication date
-                pub_date = None
-                if item.pubDate and item.pubDate.text:
-                    try:
-                        dt = dateparser.parse(item.pubDate.text, fuzzy=True)
-                        if dt:
-                            pub_date = dt.date().isoformat()
-                    except Exception as e:
-                        logger.warning(f"Failed to parse date '{item.pubDate.text}': {e}")
-                
-                # Only add items with title and URL
-                if title and url:
-                    news_item = NewsItem(
-                        title=title, 
-                        url=url, 
-                        source=source, 
-                        publication_date=pub_date
-                    )
-                    items.append(news_item)
-                    
-            except Exception as e:
-                logger.warning(f"Failed to parse RSS item: {e}")
-                continue
-        
+        items = _collect_news_items(rss_items, max_items)
         logger.info(f"Successfully parsed {len(items)} news items")
         return items
         
+    except ET.ParseError as e:
+        # The stdlib parser has no recovery mode
+        logger.error(f"Invalid RSS feed: {e}")
+        return []
     except Exception as e:
         logger.error(f"Failed to parse RSS feed: {e}")
         return []
+    finally:
+        rss_items.close()
 
 
 def search_google_news(cfg: SearchConfig) -> List[NewsItem]:
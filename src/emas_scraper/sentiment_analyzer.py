@@ -5,13 +5,29 @@ from __future__ import annotations
 import csv
 import json
 import logging
-import pandas as pd
+import os
 import re
-from collections import Counter
+import shutil
+import sys
+import tempfile
+import weakref
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple, Union
+from types import SimpleNamespace
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib json module
+    orjson = None
+
+from ._compat import DATACLASS_SLOTS
+from .config import SearchConfig
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -96,7 +112,13 @@ STOCK_NEGATIVE_TERMS = {
 }
 
 
-@dataclass
+# Scores within +/- NEUTRAL_BAND are neutral; |score| thresholds for confidence levels
+NEUTRAL_BAND = 0.1
+CONFIDENCE_HIGH = 0.7
+CONFIDENCE_LOW = 0.4
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class SentimentResult:
     """Sentiment analysis result for a single article."""
     label: str  # 'positive', 'negative', 'neutral'
@@ -104,12 +126,13 @@ class SentimentResult:
     confidence: str  # 'high', 'medium', 'low'
     
     @classmethod
-    def from_score(cls, score: float, threshold_high: float = 0.7, threshold_low: float = 0.4) -> "SentimentResult":
+    def from_score(cls, score: float, threshold_high: float = CONFIDENCE_HIGH,
+                   threshold_low: float = CONFIDENCE_LOW) -> "SentimentResult":
         """Create SentimentResult from a score between -1 and 1."""
         # Determine label
-        if score > 0.1:
+        if score > NEUTRAL_BAND:
             label = "positive"
-        elif score < -0.1:
+        elif score < -NEUTRAL_BAND:
             label = "negative"
         else:
             label = "neutral"
@@ -126,9 +149,26 @@ class SentimentResult:
             confidence = "low"
         
         return cls(label=label, score=abs_score, confidence=confidence)
+    
+    @classmethod
+    def from_scores(cls, scores: Sequence[float], threshold_high: float = CONFIDENCE_HIGH,
+                    threshold_low: float = CONFIDENCE_LOW) -> List["SentimentResult"]:
+        """Create SentimentResults for many scores at once; same rules as from_score."""
+        import numpy as np
+        
+        scores = np.asarray(scores, dtype=float)
+        labels = np.select([scores > NEUTRAL_BAND, scores < -NEUTRAL_BAND], ["positive", "negative"], "neutral")
+        abs_scores = np.abs(scores)
+        confidences = np.select([abs_scores >= threshold_high, abs_scores >= threshold_low], ["high", "medium"], "low")
+        
+        return [
+            # numpy hands back fresh strings; intern them so results share one copy
+            cls(label=sys.intern(label), score=score, confidence=sys.intern(confidence))
+            for label, score, confidence in zip(labels.tolist(), abs_scores.tolist(), confidences.tolist())
+        ]
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class NewsArticle:
     """News article data structure."""
     title: str
@@ -148,7 +188,7 @@ class Comment:
     post_id: str
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class AnalysisResult:
     """Complete sentiment analysis result."""
     article: NewsArticle
@@ -156,7 +196,7 @@ class AnalysisResult:
     method: str  # 'indonesian_bert', 'textblob_fallback'
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class EnhancedSentimentResult:
     """Enhanced sentiment result with stock-specific adjustments."""
     original_label: str
@@ -164,7 +204,7 @@ class EnhancedSentimentResult:
     stock_adjusted_label: str
     stock_adjusted_score: float
     confidence: str
-    stock_terms_found: List[str]
+    stock_terms_found: Tuple[str, ...]
     adjustment_reason: str
 
 
@@ -177,17 +217,131 @@ class CommentAnalysisResult:
     enhanced_sentiment: Optional[EnhancedSentimentResult] = None
 
 
+BERT_MODEL_NAME = "ayameRushia/bert-base-indonesian-1.5G-sentiment-analysis-smsa"
+
+# INT8 ONNX export of BERT_MODEL_NAME, written by quantize_model.py at the repo root.
+# Anchored to the checkout (src/emas_scraper/../..) so the lookup does not depend on
+# the working directory; EMAS_QUANTIZED_MODEL_DIR points it elsewhere.
+QUANTIZED_MODEL_DIR = Path(
+    os.environ.get(
+        "EMAS_QUANTIZED_MODEL_DIR",
+        Path(__file__).resolve().parents[2] / "models" / "indo-bert-int8",
+    )
+)
+QUANTIZED_MODEL_FILE = "model_quantized.onnx"
+
+# Label mapping based on the model specification
+BERT_LABELS = {0: "Positive", 1: "Neutral", 2: "Negative"}
+
+# Texts per forward pass in IndonesianSentimentAnalyzer.analyze_batch
+BERT_BATCH_SIZE = 32
+
+# Tokens per text in the TorchScript trace; a traced model only accepts this shape
+TRACE_MAX_LENGTH = 128
+
+# Articles per analyze_batch call when results are streamed into a report
+REPORT_CHUNK_SIZE = 512
+
+# Below this many texts, TextBlob runs in-process rather than on a process pool
+TEXTBLOB_POOL_MIN_TEXTS = 64
+
+# Upper bound on TextBlob worker processes; each one re-imports this module on spawn
+TEXTBLOB_POOL_MAX_WORKERS = 4
+
+# Distinct texts remembered by each analyzer's analyze_text and analyze_batch
+ANALYSIS_CACHE_SIZE = 4096
+
+# Word cloud cleaning patterns, compiled once for per-comment use
+URL_MENTION_RE = re.compile(r'http\S+|www\S+|@\w+|#\w+')
+SYMBOL_TAG_RE = re.compile(r'\$([A-Z]{3,4})')
+NON_WORD_RE = re.compile(r'[^\w\s\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF]')
+
+
+def clean_text_for_wordcloud(text: str, stopwords: Set[str] = INDONESIAN_STOPWORDS) -> str:
+    """Clean text by removing stopwords and non-meaningful words."""
+    # Convert to lowercase
+    text = text.lower()
+    
+    # Remove URLs, mentions, hashtags
+    text = URL_MENTION_RE.sub('', text)
+    
+    # Remove stock symbols like $EMAS, $ANTM etc but keep the symbol for context
+    text = SYMBOL_TAG_RE.sub(r'\1', text)
+    
+    # Remove punctuation except emojis
+    text = NON_WORD_RE.sub(' ', text)
+    
+    # Split into words and filter stopwords
+    words = text.split()
+    filtered_words = [word for word in words if word not in stopwords and len(word) > 2]
+    
+    return ' '.join(filtered_words)
+
+
+def analyze_with_textblob(text: str) -> Tuple[SentimentResult, str]:
+    """Analyze sentiment using TextBlob; module-level so process pools can run it."""
+    try:
+        from textblob import TextBlob
+        
+        blob = TextBlob(text)
+        polarity = blob.sentiment.polarity  # -1 to 1
+        
+        sentiment = SentimentResult.from_score(polarity)
+        return sentiment, "textblob_fallback"
+        
+    except Exception as e:
+        logger.error(f"TextBlob analysis failed: {e}")
+        # Return neutral as last resort
+        sentiment = SentimentResult(label="neutral", score=0.0, confidence="low")
+        return sentiment, "error_fallback"
+
+
+class TracedClassifier:
+    """Wrap a traced classifier so it is called like the Hugging Face model.
+    
+    The trace is recorded for batch_size rows of max_length tokens, so inputs must
+    be padded to max_length; any number of rows is accepted.
+    """
+    
+    def __init__(self, traced, batch_size: int = BERT_BATCH_SIZE, max_length: int = TRACE_MAX_LENGTH):
+        self.traced = traced
+        self.batch_size = batch_size
+        self.max_length = max_length
+    
+    def __call__(self, input_ids, attention_mask, **kwargs) -> SimpleNamespace:
+        import torch
+        import torch.nn.functional as F
+        
+        logits = []
+        for start in range(0, input_ids.shape[0], self.batch_size):
+            ids = input_ids[start:start + self.batch_size]
+            mask = attention_mask[start:start + self.batch_size]
+            rows = ids.shape[0]
+            if rows < self.batch_size:
+                # Fill the traced batch with fully masked rows and drop their logits
+                ids = F.pad(ids, (0, 0, 0, self.batch_size - rows))
+                mask = F.pad(mask, (0, 0, 0, self.batch_size - rows))
+            # Traced inputs are positional; single-sentence token_type_ids are all zeros anyway
+            logits.append(self.traced(ids, mask)[0][:rows])
+        return SimpleNamespace(logits=torch.cat(logits))
+
+
 class IndonesianSentimentAnalyzer:
     """Indonesian sentiment analyzer using BERT or TextBlob fallback with integrated stock enhancement."""
     
-    def __init__(self, use_stock_enhancement: bool = True):
+    def __init__(self, use_stock_enhancement: bool = True, use_torchscript: bool = False):
         self.model = None
         self.tokenizer = None
         self.model_loaded = False
         self.use_stock_enhancement = use_stock_enhancement
+        self.use_torchscript = use_torchscript
+        self.device = "cpu"
         self.positive_terms = STOCK_POSITIVE_TERMS
         self.negative_terms = STOCK_NEGATIVE_TERMS
         self.stopwords = INDONESIAN_STOPWORDS
+        # Per instance, so cached results never outlive or cross analyzers
+        self._analysis_cache: OrderedDict = OrderedDict()
+        self._textblob_pool: Optional[ProcessPoolExecutor] = None
         self._load_model()
     
     def _load_model(self) -> None:
@@ -196,9 +350,15 @@ class IndonesianSentimentAnalyzer:
             logger.info("Loading Indonesian BERT model...")
             from transformers import AutoTokenizer, AutoModelForSequenceClassification
             
-            model_name = "ayameRushia/bert-base-indonesian-1.5G-sentiment-analysis-smsa"
-            self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-            self.model = AutoModelForSequenceClassification.from_pretrained(model_name)
+            self.tokenizer = AutoTokenizer.from_pretrained(BERT_MODEL_NAME)
+            self.model = self._load_quantized_model()
+            if self.model is None and self.use_torchscript:
+                # torchscript=True makes the model traceable (tuple outputs)
+                model = AutoModelForSequenceClassification.from_pretrained(BERT_MODEL_NAME, torchscript=True)
+                self.model = self._trace_model(model)
+            elif self.model is None:
+                self.model = AutoModelForSequenceClassification.from_pretrained(BERT_MODEL_NAME)
+                self._move_model_to_gpu()
             self.model_loaded = True
             logger.info("Indonesian BERT model loaded successfully")
             
@@ -207,15 +367,120 @@ class IndonesianSentimentAnalyzer:
             logger.info("Will use TextBlob fallback for sentiment analysis")
             self.model_loaded = False
     
+    def _load_quantized_model(self):
+        """Load the INT8 ONNX model if it has been exported; None to use PyTorch."""
+        if not (QUANTIZED_MODEL_DIR / QUANTIZED_MODEL_FILE).exists():
+            return None
+        
+        try:
+            from optimum.onnxruntime import ORTModelForSequenceClassification
+            
+            model = ORTModelForSequenceClassification.from_pretrained(
+                QUANTIZED_MODEL_DIR,
+                file_name=QUANTIZED_MODEL_FILE,
+                provider="CPUExecutionProvider"
+            )
+            logger.info(f"Using quantized ONNX model from {QUANTIZED_MODEL_DIR}")
+            return model
+            
+        except Exception as e:
+            logger.warning(f"Failed to load quantized ONNX model: {e}, using PyTorch model")
+            return None
+    
+    def _move_model_to_gpu(self) -> None:
+        """Run the PyTorch model on CUDA in half precision when a GPU is available."""
+        try:
+            import torch
+        except ImportError:
+            return
+        
+        if not (isinstance(self.model, torch.nn.Module) and torch.cuda.is_available()):
+            return
+        
+        # FP16 halves weight traffic and runs the matmuls on tensor cores
+        self.model = self.model.half().to("cuda")
+        self.device = "cuda"
+        logger.info("Indonesian BERT model moved to CUDA (fp16)")
+    
+    def _trace_model(self, model):
+        """Trace the PyTorch model with TorchScript; the eager model is kept if tracing fails."""
+        try:
+            import torch
+            
+            model.eval()
+            example = self.tokenizer(
+                ["contoh teks"] * BERT_BATCH_SIZE, return_tensors="pt",
+                padding="max_length", max_length=TRACE_MAX_LENGTH, truncation=True
+            )
+            traced = torch.jit.trace(model, (example["input_ids"], example["attention_mask"]), strict=False)
+            logger.info("Indonesian BERT model traced with TorchScript")
+            return TracedClassifier(traced, BERT_BATCH_SIZE, TRACE_MAX_LENGTH)
+            
+        except Exception as e:
+            logger.warning(f"TorchScript tracing failed: {e}, using eager model")
+            return model
+    
     def analyze_text(self, text: str) -> Tuple[SentimentResult, str, Optional[EnhancedSentimentResult]]:
         """Analyze sentiment of text using BERT or TextBlob fallback with integrated stock enhancement."""
+        # Syndicated headlines repeat verbatim; analyze each distinct text once
+        result = self._cache_get(text)
+        if result is None:
+            result = self._analyze_text_uncached(text)
+            self._cache_put(text, result)
+        return result
+    
+    def _cache_get(self, text: str) -> Optional[Tuple[SentimentResult, str, Optional[EnhancedSentimentResult]]]:
+        """Cached analysis of text, marked as most recently used; None on a miss."""
+        result = self._analysis_cache.get(text)
+        if result is not None:
+            self._analysis_cache.move_to_end(text)
+        return result
+    
+    def _cache_put(self, text: str, result: Tuple[SentimentResult, str, Optional[EnhancedSentimentResult]]) -> None:
+        """Remember an analysis, evicting the least recently used beyond ANALYSIS_CACHE_SIZE."""
+        self._analysis_cache[text] = result
+        if len(self._analysis_cache) > ANALYSIS_CACHE_SIZE:
+            self._analysis_cache.popitem(last=False)
+    
+    def _analyze_text_uncached(self, text: str) -> Tuple[SentimentResult, str, Optional[EnhancedSentimentResult]]:
+        """Analyze one text without consulting the cache."""
         # Get base sentiment analysis
         if self.model_loaded and self.model is not None:
             sentiment, method = self._analyze_with_bert(text)
         else:
             sentiment, method = self._analyze_with_textblob(text)
         
-        # Apply stock-specific enhancement if enabled
+        return self._apply_stock_enhancement(text, sentiment, method)
+    
+    def analyze_batch(self, texts: List[str], batch_size: int = BERT_BATCH_SIZE
+                      ) -> List[Tuple[SentimentResult, str, Optional[EnhancedSentimentResult]]]:
+        """Analyze many texts at once; same results as analyze_text, in input order."""
+        # Repeated texts (reposted titles, copy-paste comments) are analyzed once,
+        # and texts seen by earlier calls come straight from the cache
+        results = {}
+        missing = []
+        for text in dict.fromkeys(texts):
+            cached = self._cache_get(text)
+            if cached is None:
+                missing.append(text)
+            else:
+                results[text] = cached
+        
+        if missing:
+            if self.model_loaded and self.model is not None:
+                base_sentiments = self._analyze_batch_with_bert(missing, batch_size)
+            else:
+                base_sentiments = self._analyze_batch_with_textblob(missing)
+            for text, (sentiment, method) in zip(missing, base_sentiments):
+                result = self._apply_stock_enhancement(text, sentiment, method)
+                results[text] = result
+                self._cache_put(text, result)
+        
+        return [results[text] for text in texts]
+    
+    def _apply_stock_enhancement(self, text: str, sentiment: SentimentResult, method: str
+                                 ) -> Tuple[SentimentResult, str, Optional[EnhancedSentimentResult]]:
+        """Apply stock-specific enhancement to a base sentiment if enabled."""
         enhanced_sentiment = None
         if self.use_stock_enhancement:
             enhanced_sentiment = self.enhance_sentiment(
@@ -231,6 +496,13 @@ class IndonesianSentimentAnalyzer:
         
         return sentiment, method, enhanced_sentiment
     
+    def _tokenize(self, texts):
+        """Tokenize texts for the loaded model, padded to the traced length for a TorchScript model."""
+        if isinstance(self.model, TracedClassifier):
+            return self.tokenizer(texts, return_tensors="pt", padding="max_length",
+                                  max_length=self.model.max_length, truncation=True)
+        return self.tokenizer(texts, return_tensors="pt", padding=True, truncation=True, max_length=512)
+    
     def _analyze_with_bert(self, text: str) -> Tuple[SentimentResult, str]:
         """Analyze sentiment using Indonesian BERT."""
         try:
@@ -239,7 +511,9 @@ class IndonesianSentimentAnalyzer:
             
             # Tokenize input text (truncate if too long)
             text_truncated = text[:512]  # BERT max length
-            inputs = self.tokenizer(text_truncated, return_tensors="pt", padding=True, truncation=True, max_length=512)
+            inputs = self._tokenize(text_truncated)
+            if self.device != "cpu":
+                inputs = inputs.to(self.device)
             
             # Get model predictions
             with torch.no_grad():
@@ -247,62 +521,100 @@ class IndonesianSentimentAnalyzer:
                 predictions = torch.argmax(outputs.logits, dim=-1)
                 probabilities = F.softmax(outputs.logits, dim=-1)
             
-            # Label mapping based on the model specification
-            label_map = {0: "Positive", 1: "Neutral", 2: "Negative"}
-            predicted_label = label_map[predictions.item()]
             confidence_score = torch.max(probabilities).item()
-            
-            # Convert to our standard format
-            if predicted_label == "Positive":
-                final_score = confidence_score
-            elif predicted_label == "Negative":
-                final_score = -confidence_score
-            else:  # Neutral
-                final_score = 0.0
-            
-            sentiment = SentimentResult.from_score(final_score)
+            sentiment = SentimentResult.from_score(self._bert_score(predictions.item(), confidence_score))
             return sentiment, "indonesian_bert"
             
         except Exception as e:
             logger.warning(f"BERT analysis failed: {e}, falling back to TextBlob")
             return self._analyze_with_textblob(text)
     
-    def _analyze_with_textblob(self, text: str) -> Tuple[SentimentResult, str]:
-        """Analyze sentiment using TextBlob as fallback."""
+    def _analyze_batch_with_bert(self, texts: List[str], batch_size: int) -> List[Tuple[SentimentResult, str]]:
+        """Analyze texts with Indonesian BERT, one padded forward pass per batch."""
         try:
-            from textblob import TextBlob
-            
-            blob = TextBlob(text)
-            polarity = blob.sentiment.polarity  # -1 to 1
+            import torch
+        except ImportError as e:
+            logger.warning(f"BERT analysis failed: {e}, falling back to TextBlob")
+            return [self._analyze_with_textblob(text) for text in texts]
+        
+        results: List[Optional[Tuple[SentimentResult, str]]] = [None] * len(texts)
+        
+        # Similar lengths share a batch, so little of each batch is padding
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        
+        for start in range(0, len(order), batch_size):
+            indices = order[start:start + batch_size]
+            batch = [texts[i][:512] for i in indices]  # BERT max length
             
-            sentiment = SentimentResult.from_score(polarity)
-            return sentiment, "textblob_fallback"
+            try:
+                inputs = self._tokenize(batch)
+                if self.device != "cpu":
+                    inputs = inputs.to(self.device)
+                with torch.inference_mode():
+                    probabilities = torch.softmax(self.model(**inputs).logits, dim=-1)
+                confidences, predictions = probabilities.max(dim=-1)
+            except Exception as e:
+                logger.warning(f"BERT batch analysis failed: {e}, falling back to TextBlob")
+                for i in indices:
+                    results[i] = self._analyze_with_textblob(texts[i])
+                continue
             
+            scores = [
+                self._bert_score(prediction, confidence)
+                for prediction, confidence in zip(predictions.tolist(), confidences.tolist())
+            ]
+            for i, sentiment in zip(indices, SentimentResult.from_scores(scores)):
+                results[i] = (sentiment, "indonesian_bert")
+        
+        return results
+    
+    @staticmethod
+    def _bert_score(prediction: int, confidence: float) -> float:
+        """Convert a BERT class and its probability to a score between -1 and 1."""
+        predicted_label = BERT_LABELS[prediction]
+        if predicted_label == "Positive":
+            return confidence
+        elif predicted_label == "Negative":
+            return -confidence
+        return 0.0  # Neutral
+    
+    def _analyze_with_textblob(self, text: str) -> Tuple[SentimentResult, str]:
+        """Analyze sentiment using TextBlob as fallback."""
+        return analyze_with_textblob(text)
+    
+    def _analyze_batch_with_textblob(self, texts: List[str]) -> List[Tuple[SentimentResult, str]]:
+        """Analyze texts with TextBlob, spread over processes for larger inputs."""
+        if len(texts) < TEXTBLOB_POOL_MIN_TEXTS:
+            return [self._analyze_with_textblob(text) for text in texts]
+        
+        try:
+            # TextBlob is pure Python, so only processes get around the GIL
+            executor = self._get_textblob_pool()
+            return list(executor.map(analyze_with_textblob, texts, chunksize=16))
         except Exception as e:
-            logger.error(f"TextBlob analysis failed: {e}")
-            # Return neutral as last resort
-            sentiment = SentimentResult(label="neutral", score=0.0, confidence="low")
-            return sentiment, "error_fallback"
+            logger.warning(f"TextBlob process pool failed: {e}, analyzing in-process")
+            # Start a fresh pool next time in case this one is broken
+            self.close()
+            return [self._analyze_with_textblob(text) for text in texts]
+    
+    def _get_textblob_pool(self) -> ProcessPoolExecutor:
+        """Worker pool for TextBlob batches, started on first use and kept for the analyzer's lifetime."""
+        if self._textblob_pool is None:
+            workers = min(TEXTBLOB_POOL_MAX_WORKERS, os.cpu_count() or 1)
+            self._textblob_pool = ProcessPoolExecutor(max_workers=workers)
+            # Shut the workers down if the analyzer is dropped without close()
+            weakref.finalize(self, self._textblob_pool.shutdown, wait=False)
+        return self._textblob_pool
+    
+    def close(self) -> None:
+        """Shut down the TextBlob worker pool, if one was started."""
+        if self._textblob_pool is not None:
+            self._textblob_pool.shutdown(wait=False)
+            self._textblob_pool = None
     
     def clean_text_for_wordcloud(self, text: str) -> str:
         """Clean text by removing stopwords and non-meaningful words."""
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove URLs, mentions, hashtags
-        text = re.sub(r'http\S+|www\S+|@\w+|#\w+', '', text)
-        
-        # Remove stock symbols like $EMAS, $ANTM etc but keep the symbol for context
-        text = re.sub(r'\$([A-Z]{3,4})', r'\1', text)
-        
-        # Remove punctuation except emojis
-        text = re.sub(r'[^\w\s\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF]', ' ', text)
-        
-        # Split into words and filter stopwords
-        words = text.split()
-        filtered_words = [word for word in words if word not in self.stopwords and len(word) > 2]
-        
-        return ' '.join(filtered_words)
+        return clean_text_for_wordcloud(text, self.stopwords)
     
     def find_stock_terms(self, text: str) -> Tuple[List[str], float]:
         """Find stock-specific terms and calculate sentiment adjustment."""
@@ -378,38 +690,98 @@ class IndonesianSentimentAnalyzer:
             stock_adjusted_label=new_label,
             stock_adjusted_score=abs(adjusted_score),
             confidence=confidence,
-            stock_terms_found=stock_terms,
+            stock_terms_found=tuple(stock_terms),
             adjustment_reason=adjustment_reason
         )
 
 
-def load_news_data(file_path: Path) -> List[NewsArticle]:
-    """Load news articles from JSON file."""
+# JSON input: a path, raw bytes already in memory, or a binary file-like object
+JsonSource = Union[Path, str, bytes, bytearray, IO[bytes]]
+
+
+def _describe_source(source: JsonSource) -> str:
+    """Name a JSON source for logs and report metadata without dumping its contents."""
+    if isinstance(source, (bytes, bytearray)):
+        return "<bytes>"
+    if hasattr(source, 'read'):
+        return str(getattr(source, 'name', '<stream>'))
+    return str(source)
+
+
+def _read_json(source: JsonSource):
+    """Parse JSON from a path, bytes or file-like object, with orjson when it is installed."""
+    if isinstance(source, (bytes, bytearray)):
+        data = source
+    elif hasattr(source, 'read'):
+        data = source.read()
+    else:
+        data = Path(source).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps_json(obj, indent_level: int = 0) -> bytes:
+    """Serialize obj as indented UTF-8 JSON, nested indent_level levels deep."""
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        data = json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+    if indent_level:
+        data = data.replace(b'\n', b'\n' + b'  ' * indent_level)
+    return data
+
+
+def _write_json(obj, output_file: Path) -> None:
+    """Write indented UTF-8 JSON, with orjson when it is installed."""
+    if orjson is not None:
+        Path(output_file).write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(obj, f, ensure_ascii=False, indent=2)
+
+
+def _intern_optional(value: Optional[str]) -> Optional[str]:
+    """Intern repeated strings such as source names; None and non-strings pass through."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def load_news_data(source: JsonSource) -> List[NewsArticle]:
+    """Load news articles from a JSON file path, JSON bytes or a binary file-like object."""
+    source_name = _describe_source(source)
+    # Read directly; a missing file surfaces as FileNotFoundError without a separate stat
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        articles = []
-        for item in data:
-            article = NewsArticle(
+        data = _read_json(source)
+    except FileNotFoundError:
+        logger.error(f"News data file not found: {source_name}")
+        return []
+    except (OSError, ValueError) as e:  # unreadable file or invalid JSON
+        logger.error(f"Failed to load news data from {source_name}: {e}")
+        return []
+    
+    try:
+        articles = [
+            NewsArticle(
                 title=item.get('title', ''),
                 url=item.get('url', ''),
-                source=item.get('source'),
+                source=_intern_optional(item.get('source')),
                 publication_date=item.get('publication_date')
             )
-            articles.append(article)
-        
-        logger.info(f"Loaded {len(articles)} articles from {file_path}")
-        return articles
-        
-    except Exception as e:
-        logger.error(f"Failed to load news data from {file_path}: {e}")
+            for item in data
+        ]
+    except (AttributeError, TypeError) as e:  # not a list of article objects
+        logger.error(f"Unexpected news data format in {source_name}: {e}")
         return []
+    
+    logger.info(f"Loaded {len(articles)} articles from {source_name}")
+    return articles
 
 
 def load_comments_data(file_path: Path) -> List[Comment]:
     """Load comments from CSV file."""
     try:
+        import pandas as pd  # deferred: only the comments pipeline needs pandas
+        
         df = pd.read_csv(file_path, encoding='utf-8')
         
         comments = []
@@ -432,153 +804,224 @@ def load_comments_data(file_path: Path) -> List[Comment]:
         return []
 
 
-def analyze_sentiment_batch(articles: List[NewsArticle]) -> List[AnalysisResult]:
-    """Analyze sentiment for a batch of articles."""
-    analyzer = IndonesianSentimentAnalyzer()
+@lru_cache(maxsize=1)
+def _load_shared_analyzer() -> IndonesianSentimentAnalyzer:
+    """Build the analyzer behind _get_analyzer; cleared when its model failed to load."""
+    return IndonesianSentimentAnalyzer()
+
+
+def _get_analyzer() -> IndonesianSentimentAnalyzer:
+    """Shared analyzer, so the BERT weights are loaded once per process."""
+    analyzer = _load_shared_analyzer()
+    if not analyzer.model_loaded:
+        # Retry the model load next time rather than pinning the process to TextBlob
+        _load_shared_analyzer.cache_clear()
+    return analyzer
+
+
+def _analyze_articles(analyzer: IndonesianSentimentAnalyzer, articles: List[NewsArticle]) -> List[AnalysisResult]:
+    """Analyze one batch of article titles, with error results if the batch fails."""
     results = []
     
-    logger.info(f"Starting sentiment analysis for {len(articles)} articles...")
+    try:
+        # Use titles for sentiment analysis (most important part)
+        analyses = analyzer.analyze_batch([article.title for article in articles])
+    except Exception as e:
+        logger.error(f"Failed to analyze articles: {e}")
+        analyses = [None] * len(articles)
     
-    for i, article in enumerate(articles, 1):
-        logger.info(f"Analyzing article {i}/{len(articles)}: {article.title[:50]}...")
-        
-        try:
-            # Use title for sentiment analysis (most important part)
-            sentiment, method = analyzer.analyze_text(article.title)
-            
-            result = AnalysisResult(
-                article=article,
-                sentiment=sentiment,
-                method=method
-            )
-            results.append(result)
-            
-        except Exception as e:
-            logger.error(f"Failed to analyze article {i}: {e}")
+    for article, analysis in zip(articles, analyses):
+        if analysis is None:
             # Add error result
             error_sentiment = SentimentResult(label="neutral", score=0.0, confidence="low")
-            result = AnalysisResult(
-                article=article,
-                sentiment=error_sentiment,
-                method="error"
-            )
-            results.append(result)
+            results.append(AnalysisResult(article=article, sentiment=error_sentiment, method="error"))
+            continue
+        
+        sentiment, method, _ = analysis
+        results.append(AnalysisResult(article=article, sentiment=sentiment, method=method))
     
+    return results
+
+
+def analyze_sentiment_batch(articles: List[NewsArticle]) -> List[AnalysisResult]:
+    """Analyze sentiment for a batch of articles."""
+    logger.info(f"Starting sentiment analysis for {len(articles)} articles...")
+    results = _analyze_articles(_get_analyzer(), articles)
     logger.info(f"Sentiment analysis completed for {len(results)} articles")
     return results
 
 
+def iter_sentiment_results(articles: Iterable[NewsArticle],
+                           chunk_size: int = REPORT_CHUNK_SIZE) -> Iterator[AnalysisResult]:
+    """Analyze articles chunk_size at a time, yielding each chunk's results as it finishes."""
+    analyzer = _get_analyzer()
+    articles = iter(articles)
+    while True:
+        chunk = list(islice(articles, chunk_size))
+        if not chunk:
+            break
+        yield from _analyze_articles(analyzer, chunk)
+
+
 def analyze_comments_sentiment_batch(comments: List[Comment]) -> List[CommentAnalysisResult]:
     """Analyze sentiment for a batch of comments with stock enhancement."""
-    analyzer = IndonesianSentimentAnalyzer(use_stock_enhancement=True)
+    analyzer = _get_analyzer()  # stock enhancement is on by default
     results = []
     
     logger.info(f"Starting enhanced sentiment analysis for {len(comments)} comments...")
     
-    for i, comment in enumerate(comments, 1):
-        if i % 100 == 0:  # Log progress every 100 comments
-            logger.info(f"Analyzing comment {i}/{len(comments)}")
-        
-        try:
-            # Use comment_text for sentiment analysis
-            sentiment, method, enhanced_sentiment = analyzer.analyze_text(comment.comment_text)
-            
-            result = CommentAnalysisResult(
-                comment=comment,
-                sentiment=sentiment,
-                method=method,
-                enhanced_sentiment=enhanced_sentiment
-            )
-            results.append(result)
-            
-        except Exception as e:
-            logger.error(f"Failed to analyze comment {i}: {e}")
+    try:
+        # Use comment_text for sentiment analysis
+        analyses = analyzer.analyze_batch([comment.comment_text for comment in comments])
+    except Exception as e:
+        logger.error(f"Failed to analyze comments: {e}")
+        analyses = [None] * len(comments)
+    
+    for comment, analysis in zip(comments, analyses):
+        if analysis is None:
             # Add error result
             error_sentiment = SentimentResult(label="neutral", score=0.0, confidence="low")
-            result = CommentAnalysisResult(
+            results.append(CommentAnalysisResult(
                 comment=comment,
                 sentiment=error_sentiment,
                 method="error",
                 enhanced_sentiment=None
-            )
-            results.append(result)
+            ))
+            continue
+        
+        sentiment, method, enhanced_sentiment = analysis
+        results.append(CommentAnalysisResult(
+            comment=comment,
+            sentiment=sentiment,
+            method=method,
+            enhanced_sentiment=enhanced_sentiment
+        ))
     
     logger.info(f"Enhanced sentiment analysis completed for {len(results)} comments")
     return results
 
 
+def _result_detail(result: AnalysisResult) -> Dict:
+    """Detailed report entry for one analyzed article."""
+    sentiment = result.sentiment
+    article = result.article
+    return {
+        "title": article.title,
+        "url": article.url,
+        "source": article.source,
+        "publication_date": article.publication_date,
+        "sentiment": {
+            "label": sentiment.label,
+            "score": round(sentiment.score, 3),
+            "confidence": sentiment.confidence
+        },
+        "analysis_method": result.method
+    }
+
+
+class _ReportCounter:
+    """Running sentiment, confidence and method counts for an analysis report."""
+    
+    def __init__(self):
+        self.sentiment_counts = {"positive": 0, "negative": 0, "neutral": 0}
+        self.method_counts: Dict[str, int] = {}
+        self.confidence_counts = {"high": 0, "medium": 0, "low": 0}
+        self.total = 0
+    
+    def add(self, result: AnalysisResult) -> None:
+        """Count one analyzed article."""
+        self.sentiment_counts[result.sentiment.label] += 1
+        self.method_counts[result.method] = self.method_counts.get(result.method, 0) + 1
+        self.confidence_counts[result.sentiment.confidence] += 1
+        self.total += 1
+    
+    def summary(self, source_file: str) -> Dict:
+        """Report metadata and sentiment summary for everything counted so far."""
+        total = self.total
+        return {
+            "analysis_metadata": {
+                "analysis_date": datetime.now().isoformat(),
+                "source_file": source_file,
+                "total_articles": total,
+                "analysis_methods_used": self.method_counts
+            },
+            "sentiment_summary": {
+                "by_sentiment": self.sentiment_counts,
+                "by_confidence": self.confidence_counts,
+                "sentiment_percentages": {
+                    label: round((count / total) * 100, 1) if total else 0.0
+                    for label, count in self.sentiment_counts.items()
+                }
+            }
+        }
+
+
 def create_analysis_report(results: List[AnalysisResult], source_file: str) -> Dict:
     """Create comprehensive analysis report."""
-    # Count sentiments
-    sentiment_counts = {"positive": 0, "negative": 0, "neutral": 0}
-    method_counts = {}
-    confidence_counts = {"high": 0, "medium": 0, "low": 0}
-    
-    analysis_data = []
-    
-    for result in results:
-        # Count sentiments
-        sentiment_counts[result.sentiment.label] += 1
-        
-        # Count methods
-        method_counts[result.method] = method_counts.get(result.method, 0) + 1
-        
-        # Count confidence levels
-        confidence_counts[result.sentiment.confidence] += 1
-        
-        # Add to analysis data
-        analysis_data.append({
-            "title": result.article.title,
-            "url": result.article.url,
-            "source": result.article.source,
-            "publication_date": result.article.publication_date,
-            "sentiment": {
-                "label": result.sentiment.label,
-                "score": round(result.sentiment.score, 3),
-                "confidence": result.sentiment.confidence
-            },
-            "analysis_method": result.method
-        })
+    counter = _ReportCounter()
+    analysis_data: List[Optional[Dict]] = [None] * len(results)
+    
+    for i, result in enumerate(results):
+        counter.add(result)
+        analysis_data[i] = _result_detail(result)
     
     # Create comprehensive report
-    report = {
-        "analysis_metadata": {
-            "analysis_date": datetime.now().isoformat(),
-            "source_file": source_file,
-            "total_articles": len(results),
-            "analysis_methods_used": method_counts
-        },
-        "sentiment_summary": {
-            "by_sentiment": sentiment_counts,
-            "by_confidence": confidence_counts,
-            "sentiment_percentages": {
-                label: round((count / len(results)) * 100, 1) 
-                for label, count in sentiment_counts.items()
-            }
-        },
-        "detailed_results": analysis_data
-    }
+    report = counter.summary(source_file)
+    report["detailed_results"] = analysis_data
+    return report
+
+
+def write_analysis_report(results: Iterable[AnalysisResult], source_file: str, output_file: Path) -> Dict:
+    """Write the analysis report to a JSON file, one detailed result at a time.
+    
+    Detailed results are spooled to a temporary file while the counts are
+    tallied, so memory stays bounded and the file keeps the same key order as
+    save_analysis_report. Returns the report without detailed_results.
+    """
+    counter = _ReportCounter()
+    
+    with tempfile.TemporaryFile() as spool:
+        separator = b'\n    '
+        for result in results:
+            counter.add(result)
+            spool.write(separator + _dumps_json(_result_detail(result), indent_level=2))
+            separator = b',\n    '
+        
+        report = counter.summary(source_file)
+        with open(output_file, 'wb') as f:
+            f.write(b'{')
+            for key, value in report.items():
+                f.write(b'\n  "' + key.encode('utf-8') + b'": ' + _dumps_json(value, indent_level=1) + b',')
+            f.write(b'\n  "detailed_results": [')
+            spool.seek(0)
+            shutil.copyfileobj(spool, f)
+            f.write(b'\n  ]\n}\n' if counter.total else b']\n}\n')
     
+    logger.info(f"Analysis report saved to {output_file}")
     return report
 
 
+def _print_report_summary(report: Dict) -> None:
+    """Print the sentiment summary of an analysis report."""
+    summary = report["sentiment_summary"]["by_sentiment"]
+    total = report["analysis_metadata"]["total_articles"]
+    
+    print(f"\n📊 Sentiment Analysis Summary:")
+    print(f"Total Articles: {total}")
+    print(f"Positive: {summary['positive']} ({report['sentiment_summary']['sentiment_percentages']['positive']}%)")
+    print(f"Negative: {summary['negative']} ({report['sentiment_summary']['sentiment_percentages']['negative']}%)")
+    print(f"Neutral: {summary['neutral']} ({report['sentiment_summary']['sentiment_percentages']['neutral']}%)")
+
+
 def save_analysis_report(report: Dict, output_file: Path) -> None:
     """Save analysis report to JSON file."""
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, ensure_ascii=False, indent=2)
+        _write_json(report, output_file)
         
         logger.info(f"Analysis report saved to {output_file}")
         
         # Print summary
-        summary = report["sentiment_summary"]["by_sentiment"]
-        total = report["analysis_metadata"]["total_articles"]
-        
-        print(f"\n📊 Sentiment Analysis Summary:")
-        print(f"Total Articles: {total}")
-        print(f"Positive: {summary['positive']} ({report['sentiment_summary']['sentiment_percentages']['positive']}%)")
-        print(f"Negative: {summary['negative']} ({report['sentiment_summary']['sentiment_percentages']['negative']}%)")
-        print(f"Neutral: {summary['neutral']} ({report['sentiment_summary']['sentiment_percentages']['neutral']}%)")
+        _print_report_summary(report)
         
     except Exception as e:
         logger.error(f"Failed to save analysis report: {e}")
@@ -621,6 +1064,8 @@ def save_comments_sentiment_csv(results: List[CommentAnalysisResult], output_fil
             })
         
         # Write to CSV
+        import pandas as pd  # deferred: only the comments pipeline needs pandas
+        
         df = pd.DataFrame(csv_data)
         df.to_csv(output_file, index=False, encoding='utf-8')
         
@@ -640,8 +1085,8 @@ def save_comments_sentiment_csv(results: List[CommentAnalysisResult], output_fil
         logger.error(f"Failed to save sentiment analysis CSV: {e}")
 
 
-def analyze_news_sentiment(input_file: Path, output_file: Path) -> bool:
-    """Main function to analyze sentiment of news articles."""
+def analyze_news_sentiment(input_file: JsonSource, output_file: Path) -> bool:
+    """Main function to analyze sentiment of news articles from a JSON path, bytes or stream."""
     try:
         # Load news data
         articles = load_news_data(input_file)
@@ -649,16 +1094,56 @@ def analyze_news_sentiment(input_file: Path, output_file: Path) -> bool:
             logger.error("No articles to analyze")
             return False
         
-        # Analyze sentiment
-        results = analyze_sentiment_batch(articles)
-        if not results:
-            logger.error("Sentiment analysis failed")
-            return False
+        # Analyze in chunks and write each chunk's results out before the next
+        logger.info(f"Starting sentiment analysis for {len(articles)} articles...")
+        results = iter_sentiment_results(articles)
+        report = write_analysis_report(results, _describe_source(input_file), output_file)
+        _print_report_summary(report)
+        
+        return True
         
-        # Create and save report
-        report = create_analysis_report(results, str(input_file))
-        save_analysis_report(report, output_file)
+    except Exception as e:
+        logger.error(f"Sentiment analysis failed: {e}")
+        return False
+
+
+def _search_articles(cfg: SearchConfig) -> List[NewsArticle]:
+    """Search Google News and turn the results into articles in memory."""
+    # Deferred: only the scrape pipelines need the HTTP/RSS stack
+    from .google_news import search_google_news
+    
+    articles = [
+        NewsArticle(
+            title=item.title,
+            url=item.url,
+            source=item.source,
+            publication_date=item.publication_date
+        )
+        for item in search_google_news(cfg)
+    ]
+    logger.info(f"Loaded {len(articles)} articles from Google News")
+    return articles
+
+
+def scrape_and_analyze(cfg: SearchConfig) -> List[AnalysisResult]:
+    """Search Google News and analyze the results in memory."""
+    articles = _search_articles(cfg)
+    if not articles:
+        logger.error("No articles to analyze")
+        return []
+    return analyze_sentiment_batch(articles)
+
+
+def scrape_and_report(cfg: SearchConfig, output_file: Path) -> bool:
+    """Search Google News and stream the sentiment report for the results to output_file."""
+    try:
+        articles = _search_articles(cfg)
+        if not articles:
+            logger.error("No articles to analyze")
+            return False
         
+        report = write_analysis_report(iter_sentiment_results(articles), f"google_news:{cfg.query}", output_file)
+        _print_report_summary(report)
         return True
         
     except Exception as e:
@@ -693,8 +1178,7 @@ def analyze_comments_sentiment(input_csv: Path, output_csv: Path) -> bool:
 
 def get_meaningful_words(text: str, min_length: int = 3) -> List[str]:
     """Extract meaningful words from text for word cloud."""
-    analyzer = IndonesianSentimentAnalyzer(use_stock_enhancement=False)  # Just for text cleaning
-    cleaned_text = analyzer.clean_text_for_wordcloud(text)
+    cleaned_text = clean_text_for_wordcloud(text)
     
     # Additional filtering for meaningful words
     words = cleaned_text.split()
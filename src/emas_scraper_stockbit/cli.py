@@ -55,6 +55,11 @@ def main():
         help="Run browser in headless mode"
     )
     
+    parser.add_argument(
+        "--cookie-jar",
+        help="JSON file to save login cookies to and reuse them from on later runs"
+    )
+    
     parser.add_argument(
         "--max-scrolls",
         type=int,
@@ -125,6 +130,8 @@ def main():
         config.output_format = args.format
     if args.headless:
         config.headless = args.headless
+    if args.cookie_jar:
+        config.cookie_jar = args.cookie_jar
     if args.max_scrolls:
         config.max_scrolls = args.max_scrolls
     if args.scroll_pause:
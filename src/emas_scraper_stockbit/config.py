@@ -26,8 +26,10 @@ class StockbitConfig:
     
     # Selenium settings
     headless: bool = False
-    implicit_wait: int = 10
+    block_resources: bool = True  # skip images and fonts (and stylesheets when headless)
+    implicit_wait: int = 0  # explicit WebDriverWait is used where elements may lag
     page_load_timeout: int = 30
+    cookie_jar: Optional[str] = None  # JSON file of login cookies reused across runs
     
     # Scrolling settings
     scroll_pause_time: float = 3.0
@@ -37,6 +39,7 @@ class StockbitConfig:
     # Data collection limits
     target_data_count: int = 10000
     no_new_data_limit: int = 5
+    extract_workers: int = 1  # >1 builds comments on a thread pool
     
     # Output settings
     output_format: str = "csv"  # csv, json
@@ -80,12 +83,15 @@ class StockbitConfig:
         # Load scraping settings
         symbol = config.get('scraping', 'symbol', fallback='EMAS')
         headless = config.getboolean('scraping', 'headless', fallback=False)
-        implicit_wait = config.getint('scraping', 'implicit_wait', fallback=10)
+        block_resources = config.getboolean('scraping', 'block_resources', fallback=True)
+        implicit_wait = config.getint('scraping', 'implicit_wait', fallback=0)
         page_load_timeout = config.getint('scraping', 'page_load_timeout', fallback=30)
+        cookie_jar = config.get('scraping', 'cookie_jar', fallback=None) or None
         scroll_pause_time = config.getfloat('scraping', 'scroll_pause_time', fallback=3.0)
         max_scrolls = config.getint('scraping', 'max_scrolls', fallback=100)
         target_data_count = config.getint('scraping', 'target_data_count', fallback=10000)
         no_new_data_limit = config.getint('scraping', 'no_new_data_limit', fallback=5)
+        extract_workers = config.getint('scraping', 'extract_workers', fallback=1)
         
         # Load output settings
         output_format = config.get('output', 'format', fallback='csv')
@@ -98,12 +104,15 @@ class StockbitConfig:
             password=password,
             symbol=symbol,
             headless=headless,
+            block_resources=block_resources,
             implicit_wait=implicit_wait,
             page_load_timeout=page_load_timeout,
+            cookie_jar=cookie_jar,
             scroll_pause_time=scroll_pause_time,
             max_scrolls=max_scrolls,
             target_data_count=target_data_count,
             no_new_data_limit=no_new_data_limit,
+            extract_workers=extract_workers,
             output_format=output_format,
             output_filename=output_filename
         )
\ No newline at end of file
@@ -2,13 +2,25 @@
 Example usage script for Stockbit Stream Scraper
 """
 
+import csv
+import json
 import os
+from itertools import islice
 from pathlib import Path
 
 from config import StockbitConfig
 from scraper import StockbitScraper
 
 
+def read_sample_comments(filename, output_format, limit=3):
+    """Read the first few comments back from the output file; comments are
+    streamed to disk while scraping, so they are not kept in memory"""
+    with open(filename, 'r', encoding='utf-8', newline='') as f:
+        if output_format.lower() == 'json':
+            return json.load(f)[:limit]
+        return list(islice(csv.DictReader(f), limit))
+
+
 def main():
     """Example of how to use the Stockbit scraper programmatically"""
     
@@ -56,11 +68,12 @@ def main():
 
             
             # Show first few comments as preview
-            if scraper.data_manager.comments:
+            samples = read_sample_comments(output_file, config.output_format)
+            if samples:
                 print(f"\n📝 Sample comments (first 3):")
-                for i, comment in enumerate(scraper.data_manager.comments[:3]):
-                    print(f"   {i+1}. @{comment.username}: {comment.comment_text[:100]}...")
-                    print(f"      Likes: {comment.likes}, Replies: {comment.replies}")
+                for i, comment in enumerate(samples):
+                    print(f"   {i+1}. @{comment['username']}: {comment['comment_text'][:100]}...")
+                    print(f"      Likes: {comment['likes']}, Replies: {comment['replies']}")
                     print()
         
         else:
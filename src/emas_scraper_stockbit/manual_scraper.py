@@ -7,7 +7,6 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from config import StockbitConfig
 from scraper import StockbitScraper
-import time
 
 def manual_login_scraper():
     """
@@ -43,8 +42,9 @@ def manual_login_scraper():
         print(f"📍 Navigating to EMAS page: {config.symbol_url}")
         scraper.driver.get(config.symbol_url)
         
-        # Wait for page to load
-        time.sleep(5)
+        # Wait for stream posts to render
+        if not scraper._wait_for_posts():
+            print("⚠️ No stream posts appeared within 15 seconds")
         
         current_url = scraper.driver.current_url
         print(f"📍 Current URL: {current_url}")
@@ -2,13 +2,32 @@
 Data models for Stockbit Stream data
 """
 
+import csv
+import json
+import os
+import sys
+import textwrap
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 import pandas as pd
 
 
-@dataclass
+try:
+    from emas_scraper._compat import DATACLASS_SLOTS
+except ImportError:
+    # Direct execution from this directory leaves src/ off sys.path
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from emas_scraper._compat import DATACLASS_SLOTS
+
+# Column order for exports
+COLUMN_ORDER = [
+    'username', 'timestamp', 'comment_text',
+    'likes', 'replies', 'post_id'
+]
+
+
+@dataclass(**DATACLASS_SLOTS)
 class StreamComment:
     """Data model for a single stream comment/post"""
     
@@ -35,11 +54,89 @@ class StreamComment:
         return cls(**data)
 
 
+class StreamWriter:
+    """Writes comments to a CSV file or JSON array as they are extracted,
+    keeping only running summary statistics in memory. Rows go to a
+    '<filename>.part' file that replaces filename only once it holds at
+    least one comment, so a failed run keeps the previous output."""
+    
+    def __init__(self, filename: str, output_format: str = "csv"):
+        self.filename = filename
+        self.output_format = output_format.lower()
+        self.count = 0
+        self._users = set()
+        self._likes = 0
+        self._replies = 0
+        self._earliest: Optional[str] = None
+        self._latest: Optional[str] = None
+        
+        self._part_filename = filename + '.part'
+        self._file = open(self._part_filename, 'w', encoding='utf-8', newline='')
+        if self.output_format == 'json':
+            self._writer = None
+            self._file.write('[')
+        else:
+            self._writer = csv.DictWriter(self._file, fieldnames=COLUMN_ORDER, lineterminator='\n')
+            self._writer.writeheader()
+    
+    def write(self, comment: StreamComment):
+        """Append one comment to the file"""
+        data = comment.to_dict()
+        if self._writer is not None:
+            self._writer.writerow(data)
+        else:
+            # Same layout as json.dump(..., indent=2) of the whole list
+            self._file.write(',\n' if self.count else '\n')
+            self._file.write(textwrap.indent(json.dumps(data, ensure_ascii=False, indent=2), '  '))
+        
+        self.count += 1
+        self._users.add(comment.username)
+        self._likes += comment.likes
+        self._replies += comment.replies
+        timestamp = data['timestamp']
+        if timestamp is not None:
+            # ISO strings order the same as the datetimes they encode
+            if self._earliest is None or timestamp < self._earliest:
+                self._earliest = timestamp
+            if self._latest is None or timestamp > self._latest:
+                self._latest = timestamp
+    
+    def close(self):
+        """Finish the file, moving it onto filename if anything was written"""
+        if self._file.closed:
+            return
+        if self._writer is None:
+            self._file.write('\n]' if self.count else ']')
+        self._file.close()
+        
+        if self.count:
+            os.replace(self._part_filename, self.filename)
+        else:
+            os.remove(self._part_filename)
+    
+    def get_summary(self) -> Dict[str, Any]:
+        """Get summary statistics of the written data"""
+        if not self.count:
+            return {"total_comments": 0}
+        
+        return {
+            "total_comments": self.count,
+            "unique_users": len(self._users),
+            "total_likes": self._likes,
+            "total_replies": self._replies,
+            "date_range": {
+                "earliest": self._earliest,
+                "latest": self._latest
+            }
+        }
+
+
 class StreamDataManager:
     """Manager class for handling stream data collection and export"""
     
     def __init__(self):
         self.comments: List[StreamComment] = []
+        self.stream: Optional[StreamWriter] = None
     
     def add_comment(self, comment: StreamComment):
         """Add a comment to the collection"""
@@ -49,8 +146,27 @@ class StreamDataManager:
         """Add multiple comments to the collection"""
         self.comments.extend(comments)
     
+    def open_stream(self, filename: str, output_format: str = "csv") -> StreamWriter:
+        """Start writing comments straight to a file instead of collecting them"""
+        self.stream = StreamWriter(filename, output_format)
+        return self.stream
+    
+    def close_stream(self) -> int:
+        """Finish the open stream and return how many comments it holds; an
+        empty stream leaves any existing output file untouched"""
+        stream = self.stream
+        if stream is None:
+            return 0
+        
+        stream.close()
+        if not stream.count:
+            self.stream = None
+        return stream.count
+    
     def get_comments_count(self) -> int:
         """Get total number of comments collected"""
+        if self.stream is not None:
+            return len(self.comments) + self.stream.count
         return len(self.comments)
     
     def to_dataframe(self) -> pd.DataFrame:
@@ -62,15 +178,14 @@ class StreamDataManager:
         df = pd.DataFrame(data)
         
         # Reorder columns for better readability
-        column_order = [
-            'username', 'timestamp', 'comment_text', 
-            'likes', 'replies', 'post_id'
-        ]
-        
         # Only include columns that exist in the dataframe
-        existing_columns = [col for col in column_order if col in df.columns]
+        existing_columns = [col for col in COLUMN_ORDER if col in df.columns]
         df = df[existing_columns]
         
+        # Few distinct users post many comments each
+        if 'username' in df.columns:
+            df['username'] = df['username'].astype('category')
+        
         return df
     
     def save_to_csv(self, filename: str) -> str:
@@ -87,7 +202,6 @@ class StreamDataManager:
         if not self.comments:
             raise ValueError("No data to save")
         
-        import json
         data = [comment.to_dict() for comment in self.comments]
         
         with open(filename, 'w', encoding='utf-8') as f:
@@ -98,9 +212,13 @@ class StreamDataManager:
     def get_summary(self) -> Dict[str, Any]:
         """Get summary statistics of the collected data"""
         if not self.comments:
+            if self.stream is not None:
+                return self.stream.get_summary()
             return {"total_comments": 0}
         
         df = self.to_dataframe()
+        # Timestamps are serialized as ISO strings, which order chronologically
+        timestamps = df['timestamp'].dropna() if 'timestamp' in df.columns else pd.Series(dtype=object)
         
         summary = {
             "total_comments": len(self.comments),
@@ -108,8 +226,8 @@ class StreamDataManager:
             "total_likes": df['likes'].sum() if 'likes' in df.columns else 0,
             "total_replies": df['replies'].sum() if 'replies' in df.columns else 0,
             "date_range": {
-                "earliest": df['timestamp'].min().isoformat() if 'timestamp' in df.columns and not df['timestamp'].isna().all() else None,
-                "latest": df['timestamp'].max().isoformat() if 'timestamp' in df.columns and not df['timestamp'].isna().all() else None
+                "earliest": timestamps.min() if not timestamps.empty else None,
+                "latest": timestamps.max() if not timestamps.empty else None
             }
         }
         
@@ -2,20 +2,33 @@
 Stockbit Stream Scraper - Main scraper implementation
 """
 
+import json
+import os
+import shutil
+import sys
 import time
 import logging
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+from datetime import datetime, timedelta
+from typing import Iterator, List, Optional, Dict, Any, Tuple
 import re
-import pandas as pd
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.remote.webelement import WebElement
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    # Optional C parser; BeautifulSoup handles the same selectors without it
+    LexborHTMLParser = None
 
 try:
     from .config import StockbitConfig
@@ -25,6 +38,259 @@ except ImportError:
     from models import StreamComment, StreamDataManager
 
 
+# Chrome content settings: 2 = block
+BLOCKED_CONTENT_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.fonts": 2,
+}
+
+# Only blocked when headless - a headed window is still used by a person
+HEADLESS_BLOCKED_CONTENT_PREFS = {
+    "profile.managed_default_content_settings.stylesheets": 2,
+}
+
+# Heavy assets and trackers that never carry stream text
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf",
+    "*google-analytics.com*", "*googletagmanager.com*",
+    "*doubleclick.net*", "*facebook.net*", "*hotjar.com*",
+]
+
+
+# ChromeDriver binary resolved by webdriver-manager, cached for the process
+_DRIVER_PATH: Optional[str] = None
+
+# Stream post selectors based on actual Stockbit HTML structure, in priority order
+POST_SELECTORS = [
+    'div[data-cy*="stream-post-symbol"]',  # Primary selector from actual HTML
+    '.sc-ad32df5c-8',  # Class from actual HTML
+    'div[data-cy*="stream-post"]',  # More general data-cy selector
+    '.stream-post',  # Fallback
+    '.post-item',  # Fallback
+]
+
+# Any loaded post, for waiting on the stream to render
+POST_SELECTOR = ', '.join(POST_SELECTORS)
+
+# Stream section containers that show the symbol page has loaded
+STREAM_INDICATOR_SELECTOR = ', '.join([
+    ".stream-container",
+    ".stream-section",
+    "[data-testid='stream']",
+    ".post-container",
+    ".comment-container",
+])
+
+# Last resort when no post selector matches: stream-related class tokens
+POST_FALLBACK_SELECTOR = 'div[class*="sc-ad32df5c-8" i], div[class*="ebbJkf" i]'
+
+# Per-post fields, each list in priority order
+USERNAME_LINK_SELECTOR = 'a[href*="/"][href$="?source=2"]'  # Profile link: /username?source=2
+USERNAME_FALLBACK_SELECTOR = '.sc-ad32df5c-3.kvgQrd'  # Username link classes
+CONTENT_SELECTORS = [
+    '.sc-7f9f3cba-1.gVgfuQ',  # Specific class from HTML
+    '.sc-8a078c1d-0.sc-7f9f3cba-1',  # More general pattern
+    'p[style*="overflow-wrap"]',  # Paragraph with specific style
+    '.sc-ad32df5c-5 p',  # Paragraph inside content container
+    'p'  # Final fallback
+]
+TIMESTAMP_SELECTORS = [
+    'a[href*="/post/"] .sc-ad32df5c-3.iVkFTS',  # Specific timestamp class
+    'a[href*="/post/"]',  # Post link
+    '.ljSlgm.iVkFTS',  # Timestamp class pattern
+]
+LIKE_SELECTORS = [
+    '.likes-info',  # Based on HTML class
+    '.sc-8a078c1d-0.iLZqZP',  # Specific likes class
+    '[data-cy*="like"]',  # Data attribute
+]
+REPLY_SELECTORS = [
+    '[data-cy="company-stream-comment-icon"]',  # Based on HTML
+    '.lkviPX',  # Class near comment icon
+    'img[alt="Icon Comment New"]',  # Comment icon
+]
+# The reply selectors all target the same comment-icon area, so one union
+# query in document order replaces a subtree walk per selector
+REPLY_SELECTOR = ', '.join(REPLY_SELECTORS)
+
+EXTRACT_SELECTORS = {
+    'posts': POST_SELECTORS,
+    'fallback': POST_FALLBACK_SELECTOR,
+    'username_link': USERNAME_LINK_SELECTOR,
+    'username_fallback': USERNAME_FALLBACK_SELECTOR,
+    'content': CONTENT_SELECTORS,
+    'timestamp': TIMESTAMP_SELECTORS,
+    'likes': LIKE_SELECTORS,
+    'replies': REPLY_SELECTOR,
+}
+
+# Run in the page with EXTRACT_SELECTORS as arguments[0]; returns the raw text
+# fields per post (same rules as StockbitScraper._post_fields) so only those
+# cross the WebDriver wire instead of the serialized DOM
+EXTRACT_POSTS_JS = """
+const s = arguments[0];
+const text = el => {
+    if (!el) return '';
+    const parts = [];
+    const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+    while (walker.nextNode()) {
+        const part = walker.currentNode.nodeValue.trim();
+        if (part) parts.push(part);
+    }
+    return parts.join('');
+};
+const withDigit = t => /\\d/.test(t) ? t : '';
+const first = (post, selectors, read) => {
+    for (const selector of selectors) {
+        const el = post.querySelector(selector);
+        if (!el) continue;
+        const value = read(el);
+        if (value) return value;
+    }
+    return '';
+};
+let posts = [];
+for (const selector of s.posts) {
+    posts = document.querySelectorAll(selector);
+    if (posts.length) break;
+}
+if (!posts.length) posts = document.querySelectorAll(s.fallback);
+return Array.from(posts, post => {
+    const link = post.querySelector(s.username_link);
+    return {
+        data_cy: post.getAttribute('data-cy') || '',
+        href: link ? link.getAttribute('href') || '' : '',
+        user_text: text(post.querySelector(s.username_fallback)),
+        content: first(post, s.content, text),
+        timestamp: first(post, s.timestamp, el => withDigit(text(el))),
+        likes: first(post, s.likes, text),
+        replies: (() => {
+            for (const el of post.querySelectorAll(s.replies)) {
+                const value = withDigit(text(el.parentElement));
+                if (value) return value;
+            }
+            return '';
+        })(),
+    };
+});
+"""
+
+# Posts all live in the app's div tree; BeautifulSoup skips building head,
+# script and style nodes outside it
+POST_STRAINER = SoupStrainer('div')
+
+# Evaluated through CDP Runtime.evaluate: scroll, wait until the stream appends
+# posts (a MutationObserver resolves early; the scroll pause is the upper
+# bound), then return the post count using the first selector that matches
+SCROLL_AND_COUNT_JS = """
+(async () => {
+    const countPosts = () => {
+        for (const selector of %(selectors)s) {
+            const count = document.querySelectorAll(selector).length;
+            if (count) return count;
+        }
+        return 0;
+    };
+    const before = countPosts();
+    await new Promise(resolve => {
+        const observer = new MutationObserver(() => {
+            if (countPosts() > before) done();
+        });
+        const timer = setTimeout(() => done(), %(pause_ms)d);
+        const done = () => {
+            clearTimeout(timer);
+            observer.disconnect();
+            resolve();
+        };
+        observer.observe(document.body, {childList: true, subtree: true});
+        %(scroll)s
+    });
+    return countPosts();
+})()
+"""
+
+# Month mapping for both English and Indonesian abbreviations
+MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Mei': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Agu': 8, 'Sep': 9, 'Oct': 10, 'Okt': 10,
+    'Nov': 11, 'Dec': 12, 'Des': 12
+}
+
+RELATIVE_UNITS = {'h': 'hours', 'd': 'days', 'min': 'minutes'}
+
+# One pass over the timestamp text; the matching branch is identified by
+# which named groups are set
+TIMESTAMP_RE = re.compile(r"""
+    (?P<rel_n>\d+)\s*(?P<rel_u>min|h|d)\w*\s+ago
+  | (?P<day>\d{1,2})\s+(?P<mon>%s)\s+(?P<year>\d{2,4})[,\s]+(?P<hour>\d{1,2}):(?P<minute>\d{2})
+  | (?P<iso_year>\d{4})-(?P<iso_month>\d{1,2})-(?P<iso_day>\d{1,2})[T\s]+(?P<iso_hour>\d{1,2}):(?P<iso_minute>\d{2})
+""" % '|'.join(MONTHS), re.VERBOSE | re.IGNORECASE)
+
+# Count parsing for likes/replies ("1.2K", "3M", "1,234", "12 likes"); a
+# suffix letter only counts when it is not the start of a word
+NUMBER_RE = re.compile(r'(\d[\d,]*(?:\.\d+)?)\s*(?:([KMkm])(?![A-Za-z]))?')
+NUMBER_MULTIPLIERS = {None: 1, 'K': 1000, 'k': 1000, 'M': 1000000, 'm': 1000000}
+HAS_DIGIT_RE = re.compile(r'\d')
+
+
+@lru_cache(maxsize=None)
+def _compile_selector(selector: str) -> soupsieve.SoupSieve:
+    """Compile a CSS selector once for the BeautifulSoup fallback path. The
+    selector set is small and fixed, so the cache stays bounded."""
+    return soupsieve.compile(selector)
+
+
+# The reply union is matched against every post on the fallback path; soupsieve
+# compiles it into one matcher, so build it at import rather than on first use
+_compile_selector(REPLY_SELECTOR)
+
+
+class _SoupNode:
+    """BeautifulSoup tag exposed through the subset of the selectolax node API
+    used by the extractor, so both parsers share one extraction path"""
+
+    __slots__ = ('tag',)
+
+    def __init__(self, tag):
+        self.tag = tag
+
+    @property
+    def attributes(self) -> Dict[str, Any]:
+        return self.tag.attrs
+
+    @property
+    def parent(self) -> Optional['_SoupNode']:
+        parent = self.tag.parent
+        return _SoupNode(parent) if parent is not None else None
+
+    def css(self, selector: str) -> List['_SoupNode']:
+        return [_SoupNode(tag) for tag in _compile_selector(selector).select(self.tag)]
+
+    def css_first(self, selector: str) -> Optional['_SoupNode']:
+        tag = _compile_selector(selector).select_one(self.tag)
+        return _SoupNode(tag) if tag is not None else None
+
+    def text(self, strip: bool = False) -> str:
+        # A lone text child is read directly instead of walking and joining
+        # every descendant string
+        string = self.tag.string
+        if string is not None:
+            return string.strip() if strip else str(string)
+        return self.tag.get_text(strip=strip)
+
+
+def _parse_page(page_source: str):
+    """Parse page HTML with selectolax (lexbor) when installed, else BeautifulSoup.
+    Returns None when the page has nothing to search."""
+    if not page_source or page_source.isspace():
+        return None
+    if LexborHTMLParser is not None:
+        return LexborHTMLParser(page_source)
+    soup = BeautifulSoup(page_source, 'lxml', parse_only=POST_STRAINER)
+    return _SoupNode(soup) if len(soup) else None
+
+
 class StockbitScraper:
     """Main scraper class for Stockbit Stream data"""
     
@@ -54,7 +320,10 @@ class StockbitScraper:
         chrome_options = Options()
         
         if self.config.headless:
-            chrome_options.add_argument("--headless")
+            # New headless mode runs the full browser, without the old
+            # headless shell's rendering differences
+            chrome_options.add_argument("--headless=new")
+            chrome_options.add_argument("--window-size=1920,1080")
         
         # Anti-detection options
         chrome_options.add_argument("--no-sandbox")
@@ -76,11 +345,25 @@ class StockbitScraper:
         chrome_options.add_argument("--allow-running-insecure-content")
         chrome_options.add_argument("--disable-features=VizDisplayCompositor")
         
+        # Skip images and fonts (and stylesheets when headless) - only the
+        # DOM text is scraped
+        if self.config.block_resources:
+            prefs = dict(BLOCKED_CONTENT_PREFS)
+            if self.config.headless:
+                prefs.update(HEADLESS_BLOCKED_CONTENT_PREFS)
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.add_experimental_option("prefs", prefs)
+        
         # Create driver
+        global _DRIVER_PATH
         try:
             from webdriver_manager.chrome import ChromeDriverManager
             from selenium.webdriver.chrome.service import Service
-            service = Service(ChromeDriverManager().install())
+            # install() queries the network for the matching driver version;
+            # resolve it once per process
+            if _DRIVER_PATH is None:
+                _DRIVER_PATH = ChromeDriverManager().install()
+            service = Service(_DRIVER_PATH)
             driver = webdriver.Chrome(service=service, options=chrome_options)
         except ImportError:
             # Fallback to system Chrome driver
@@ -92,7 +375,13 @@ class StockbitScraper:
             "userAgent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
         })
         
-        # Set timeouts
+        if self.config.block_resources:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {"urls": BLOCKED_URL_PATTERNS})
+        
+        # Set timeouts. The implicit wait defaults to 0: the selector fallback
+        # loops probe many absent elements and each miss would block for the
+        # full implicit wait; elements that may lag use WebDriverWait instead.
         driver.implicitly_wait(self.config.implicit_wait)
         driver.set_page_load_timeout(self.config.page_load_timeout)
         
@@ -105,75 +394,145 @@ class StockbitScraper:
     
     def _login(self) -> bool:
         """Perform login to Stockbit"""
+        self.logger.info("Starting login process...")
         try:
-            self.logger.info("Starting login process...")
             self.driver.get(self.config.login_url)
             
             # Wait for page to load completely
             time.sleep(3)
             self.logger.info(f"Current URL after loading login page: {self.driver.current_url}")
             
-            # Wait for login form to load
-            wait = WebDriverWait(self.driver, 15)
-            
             # Log page title for debugging
             self.logger.info(f"Page title: {self.driver.title}")
-            
-            # Find username/email field (based on actual Stockbit HTML)
-            username_selectors = [
-                "#username",  # Primary selector from HTML
-                "input[data-cy='login-form-username']",  # Data attribute selector
-                "input[placeholder='Email or username']",  # Exact placeholder match
-                "input[name='email']",  # Fallback
-                "input[name='username']",  # Fallback
-                "input[type='email']",  # Fallback
-            ]
-            
-            username_field = None
-            found_selector = None
-            for selector in username_selectors:
+        except WebDriverException as e:
+            self.logger.error(f"Failed to load login page: {e.msg}")
+            return False
+        
+        fields = self._find_login_fields()
+        if fields is None:
+            return False
+        
+        username_field, password_field = fields
+        if not self._submit_credentials(username_field, password_field):
+            return False
+        
+        if not self._verify_login_success():
+            return False
+        
+        self._save_cookies()
+        return True
+    
+    def _save_cookies(self):
+        """Write the session cookies to config.cookie_jar so later runs can skip the login form"""
+        if not self.config.cookie_jar:
+            return
+        
+        try:
+            cookies = self.driver.get_cookies()
+            with open(self.config.cookie_jar, 'w', encoding='utf-8') as f:
+                json.dump(cookies, f)
+            self.logger.info(f"Saved {len(cookies)} login cookies to {self.config.cookie_jar}")
+        except (WebDriverException, OSError) as e:
+            self.logger.warning(f"Could not save login cookies: {e}")
+    
+    def _restore_session(self) -> bool:
+        """Log in from config.cookie_jar and open the symbol page. Returns False
+        when there is no usable jar and the login form is needed."""
+        cookie_jar = self.config.cookie_jar
+        if not cookie_jar or not os.path.exists(cookie_jar):
+            return False
+        
+        try:
+            with open(cookie_jar, encoding='utf-8') as f:
+                cookies = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Could not read login cookies from {cookie_jar}: {e}")
+            return False
+        
+        self.logger.info(f"Restoring {len(cookies)} login cookies from {cookie_jar}")
+        try:
+            # Cookies can only be added for the domain currently loaded
+            self.driver.get(self.config.base_url)
+            for cookie in cookies:
                 try:
-                    username_field = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
-                    found_selector = selector
-                    self.logger.info(f"Found username field with selector: {selector}")
-                    break
-                except TimeoutException:
+                    self.driver.add_cookie(cookie)
+                except WebDriverException:
                     continue
-            
-            if not username_field:
-                self.logger.error("Could not find username/email field")
-                # Log all input elements for debugging
+        except WebDriverException as e:
+            self.logger.warning(f"Could not restore login cookies: {e.msg}")
+            return False
+        
+        # Expired cookies land back on the login page
+        if not self._navigate_to_symbol() or "login" in self.driver.current_url.lower():
+            self.logger.info("Saved login cookies are no longer valid")
+            return False
+        
+        self.logger.info("Logged in from saved cookies")
+        return True
+    
+    def _find_login_fields(self) -> Optional[Tuple[WebElement, WebElement]]:
+        """Locate the username and password inputs of the login form"""
+        # Wait for login form to load
+        wait = WebDriverWait(self.driver, 15)
+        
+        # Find username/email field (based on actual Stockbit HTML)
+        username_selectors = [
+            "#username",  # Primary selector from HTML
+            "input[data-cy='login-form-username']",  # Data attribute selector
+            "input[placeholder='Email or username']",  # Exact placeholder match
+            "input[name='email']",  # Fallback
+            "input[name='username']",  # Fallback
+            "input[type='email']",  # Fallback
+        ]
+        
+        username_field = None
+        for selector in username_selectors:
+            try:
+                username_field = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
+                self.logger.info(f"Found username field with selector: {selector}")
+                break
+            except TimeoutException:
+                continue
+        
+        if not username_field:
+            self.logger.error("Could not find username/email field")
+            # Log all input elements for debugging
+            try:
                 inputs = self.driver.find_elements(By.TAG_NAME, "input")
                 self.logger.error(f"Found {len(inputs)} input elements on page")
                 for i, inp in enumerate(inputs[:5]):  # Log first 5 inputs
-                    try:
-                        self.logger.error(f"Input {i}: name='{inp.get_attribute('name')}', type='{inp.get_attribute('type')}', placeholder='{inp.get_attribute('placeholder')}'")
-                    except:
-                        pass
-                return False
-            
-            # Find password field (based on actual Stockbit HTML)
-            password_selectors = [
-                "#password",  # Primary selector from HTML
-                "input[data-cy='login-form-pw']",  # Data attribute selector
-                "input[name='password']",  # Name attribute
-                "input[type='password']",  # Type fallback
-                "input[placeholder='Password']"  # Exact placeholder match
-            ]
-            
-            password_field = None
-            for selector in password_selectors:
-                try:
-                    password_field = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    self.logger.info(f"Found password field with selector: {selector}")
-                    break
-                except NoSuchElementException:
-                    continue
-            
-            if not password_field:
-                self.logger.error("Could not find password field")
-                return False
-            
+                    self.logger.error(f"Input {i}: name='{inp.get_attribute('name')}', type='{inp.get_attribute('type')}', placeholder='{inp.get_attribute('placeholder')}'")
+            except WebDriverException:
+                pass
+            return None
+        
+        # Find password field (based on actual Stockbit HTML)
+        password_selectors = [
+            "#password",  # Primary selector from HTML
+            "input[data-cy='login-form-pw']",  # Data attribute selector
+            "input[name='password']",  # Name attribute
+            "input[type='password']",  # Type fallback
+            "input[placeholder='Password']"  # Exact placeholder match
+        ]
+        
+        password_field = None
+        for selector in password_selectors:
+            try:
+                password_field = self.driver.find_element(By.CSS_SELECTOR, selector)
+                self.logger.info(f"Found password field with selector: {selector}")
+                break
+            except NoSuchElementException:
+                continue
+        
+        if not password_field:
+            self.logger.error("Could not find password field")
+            return None
+        
+        return username_field, password_field
+    
+    def _submit_credentials(self, username_field: WebElement, password_field: WebElement) -> bool:
+        """Type the configured credentials and click the login button"""
+        try:
             # Enter credentials with human-like typing
             self.logger.info("Entering username...")
             username_field.clear()
@@ -184,174 +543,178 @@ class StockbitScraper:
             password_field.clear()
             time.sleep(0.5)
             password_field.send_keys(self.config.password)
-            
-            # Wait a bit before clicking submit
-            time.sleep(1)
-            
-            # Find and click login button (based on actual Stockbit HTML)
-            login_selectors = [
-                "#email-login-button",  # Primary selector from HTML
-                "button[data-cy='login-form-submit']",  # Data attribute selector
-                "button[type='submit']",  # Type fallback
-                "button.ant-btn-primary",  # Ant Design primary button
-                ".ant-btn.ant-btn-primary",  # Ant Design with classes
-                "form button[type='submit']"  # Form submit button fallback
-            ]
-            
-            login_button = None
-            for selector in login_selectors:
-                try:
-                    login_button = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    self.logger.info(f"Found login button with selector: {selector}")
-                    break
-                except NoSuchElementException:
-                    continue
-            
-            if not login_button:
-                self.logger.error("Could not find login button")
-                # Log all buttons for debugging
+        except WebDriverException as e:
+            self.logger.error(f"Failed to enter credentials: {e.msg}")
+            return False
+        
+        # Wait a bit before clicking submit
+        time.sleep(1)
+        
+        # Find and click login button (based on actual Stockbit HTML)
+        login_selectors = [
+            "#email-login-button",  # Primary selector from HTML
+            "button[data-cy='login-form-submit']",  # Data attribute selector
+            "button[type='submit']",  # Type fallback
+            "button.ant-btn-primary",  # Ant Design primary button
+            ".ant-btn.ant-btn-primary",  # Ant Design with classes
+            "form button[type='submit']"  # Form submit button fallback
+        ]
+        
+        login_button = None
+        for selector in login_selectors:
+            try:
+                login_button = self.driver.find_element(By.CSS_SELECTOR, selector)
+                self.logger.info(f"Found login button with selector: {selector}")
+                break
+            except NoSuchElementException:
+                continue
+        
+        if not login_button:
+            self.logger.error("Could not find login button")
+            # Log all buttons for debugging
+            try:
                 buttons = self.driver.find_elements(By.TAG_NAME, "button")
                 self.logger.error(f"Found {len(buttons)} button elements on page")
                 for i, btn in enumerate(buttons[:3]):
-                    try:
-                        self.logger.error(f"Button {i}: text='{btn.text}', type='{btn.get_attribute('type')}', class='{btn.get_attribute('class')}'")
-                    except:
-                        pass
-                return False
-            
+                    self.logger.error(f"Button {i}: text='{btn.text}', type='{btn.get_attribute('type')}', class='{btn.get_attribute('class')}'")
+            except WebDriverException:
+                pass
+            return False
+        
+        try:
             self.logger.info("Clicking login button...")
             login_button.click()
-            
-            # Wait for login to complete with longer timeout
-            self.logger.info("Waiting for login to complete...")
-            time.sleep(8)
-            
+        except WebDriverException as e:
+            self.logger.error(f"Failed to click login button: {e.msg}")
+            return False
+        
+        return True
+    
+    def _verify_login_success(self) -> bool:
+        """Check URL and page elements for signs of a successful login"""
+        # Wait for login to complete with longer timeout
+        self.logger.info("Waiting for login to complete...")
+        time.sleep(8)
+        
+        try:
             # Check if login was successful by looking for URL change
             current_url = self.driver.current_url
-            self.logger.info(f"Current URL after login attempt: {current_url}")
-            
-            # Check multiple indicators of successful login
-            login_success_indicators = [
-                "login" not in current_url.lower(),
-                "dashboard" in current_url.lower(),
-                "home" in current_url.lower(),
-                "profile" in current_url.lower(),
-                "trusted-device" in current_url.lower()  # This also indicates successful login
-            ]
-            
-            # Check for presence of logged-in user indicators
+        except WebDriverException as e:
+            self.logger.error(f"Login failed with error: {e.msg}")
+            return False
+        self.logger.info(f"Current URL after login attempt: {current_url}")
+        
+        # Check multiple indicators of successful login
+        login_success_indicators = [
+            "login" not in current_url.lower(),
+            "dashboard" in current_url.lower(),
+            "home" in current_url.lower(),
+            "profile" in current_url.lower(),
+            "trusted-device" in current_url.lower()  # This also indicates successful login
+        ]
+        
+        # Look for common post-login elements in Stockbit
+        login_success_elements = [
+            ".user-menu",
+            ".profile-menu", 
+            "[data-testid='user-menu']",
+            ".ant-dropdown-trigger",  # Ant Design dropdown (likely user menu)
+            ".avatar",
+            ".user-avatar",
+            "img[alt*='avatar']",
+            "img[alt*='profile']"
+        ]
+        
+        for selector in login_success_elements:
             try:
-                # Look for common post-login elements in Stockbit
-                login_success_elements = [
-                    ".user-menu",
-                    ".profile-menu", 
-                    "[data-testid='user-menu']",
-                    ".ant-dropdown-trigger",  # Ant Design dropdown (likely user menu)
-                    ".avatar",
-                    ".user-avatar",
-                    "img[alt*='avatar']",
-                    "img[alt*='profile']"
-                ]
-                
-                for selector in login_success_elements:
-                    try:
-                        element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        self.logger.info(f"Found post-login element: {selector} - login successful!")
-                        return True
-                    except NoSuchElementException:
-                        continue
-                        
-            except Exception as e:
-                self.logger.warning(f"Error checking for post-login indicators: {e}")
-            
-            # Handle trusted device prompt if present
-            if "trusted-device" in current_url.lower():
-                self.logger.info("Detected trusted device prompt - attempting to handle...")
-                return self._handle_trusted_device_prompt()
-            
-            if any(login_success_indicators):
-                self.logger.info("Login successful based on URL change!")
+                self.driver.find_element(By.CSS_SELECTOR, selector)
+                self.logger.info(f"Found post-login element: {selector} - login successful!")
                 return True
-            else:
-                self.logger.error("Login failed - still on login page or no success indicators found")
-                self.logger.error(f"Page title after login: {self.driver.title}")
-                return False
-                
-        except Exception as e:
-            self.logger.error(f"Login failed with error: {str(e)}")
-            return False
+            except NoSuchElementException:
+                continue
+            except WebDriverException as e:
+                self.logger.warning(f"Error checking for post-login indicators: {e.msg}")
+                break
+        
+        # Handle trusted device prompt if present
+        if "trusted-device" in current_url.lower():
+            self.logger.info("Detected trusted device prompt - attempting to handle...")
+            return self._handle_trusted_device_prompt()
+        
+        if any(login_success_indicators):
+            self.logger.info("Login successful based on URL change!")
+            return True
+        
+        self.logger.error("Login failed - still on login page or no success indicators found")
+        self.logger.error(f"Page title after login: {self.driver.title}")
+        return False
     
     def _handle_trusted_device_prompt(self) -> bool:
         """Handle the trusted device security prompt"""
+        self.logger.info("Handling trusted device prompt...")
+        
+        # Wait a bit for the page to load
+        time.sleep(3)
+        
+        # Look for common trusted device buttons
+        trusted_device_selectors = [
+            "button:contains('Trust this device')",
+            "button:contains('Trust Device')", 
+            "button:contains('Yes')",
+            "button:contains('Continue')",
+            "button:contains('Skip')",
+            ".trust-device-button",
+            ".continue-button",
+            "#trust-device",
+            "[data-cy*='trust']",
+            "[data-cy*='continue']",
+            "button[type='submit']"
+        ]
+        
+        # Try to find and click a continue/trust button
+        for selector in trusted_device_selectors:
+            try:
+                if "contains" in selector:
+                    # Handle text-based selectors
+                    text = selector.split("'")[1]
+                    xpath = f"//button[contains(text(), '{text}')]"
+                    button = self.driver.find_element(By.XPATH, xpath)
+                else:
+                    button = self.driver.find_element(By.CSS_SELECTOR, selector)
+                
+                self.logger.info(f"Found trusted device button with selector: {selector}")
+                button.click()
+                
+                # Wait for navigation
+                time.sleep(5)
+                
+                current_url = self.driver.current_url
+                self.logger.info(f"URL after handling trusted device: {current_url}")
+                
+                # Check if we're no longer on the trusted device page
+                if "trusted-device" not in current_url.lower():
+                    self.logger.info("Successfully handled trusted device prompt!")
+                    return True
+                
+            except WebDriverException:
+                continue
+        
+        # If no button found, try to skip by navigating directly to symbol page
+        self.logger.warning("Could not find trusted device button, attempting to navigate directly...")
         try:
-            self.logger.info("Handling trusted device prompt...")
-            
-            # Wait a bit for the page to load
-            time.sleep(3)
-            
-            # Look for common trusted device buttons
-            trusted_device_selectors = [
-                "button:contains('Trust this device')",
-                "button:contains('Trust Device')", 
-                "button:contains('Yes')",
-                "button:contains('Continue')",
-                "button:contains('Skip')",
-                ".trust-device-button",
-                ".continue-button",
-                "#trust-device",
-                "[data-cy*='trust']",
-                "[data-cy*='continue']",
-                "button[type='submit']"
-            ]
-            
-            # Try to find and click a continue/trust button
-            for selector in trusted_device_selectors:
-                try:
-                    if "contains" in selector:
-                        # Handle text-based selectors
-                        text = selector.split("'")[1]
-                        xpath = f"//button[contains(text(), '{text}')]"
-                        button = self.driver.find_element(By.XPATH, xpath)
-                    else:
-                        button = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    
-                    self.logger.info(f"Found trusted device button with selector: {selector}")
-                    button.click()
-                    
-                    # Wait for navigation
-                    time.sleep(5)
-                    
-                    current_url = self.driver.current_url
-                    self.logger.info(f"URL after handling trusted device: {current_url}")
-                    
-                    # Check if we're no longer on the trusted device page
-                    if "trusted-device" not in current_url.lower():
-                        self.logger.info("Successfully handled trusted device prompt!")
-                        return True
-                    
-                except (NoSuchElementException, Exception) as e:
-                    continue
-            
-            # If no button found, try to skip by navigating directly to symbol page
-            self.logger.warning("Could not find trusted device button, attempting to navigate directly...")
             self.driver.get(self.config.symbol_url)
             time.sleep(5)
-            
             current_url = self.driver.current_url
-            if "symbol" in current_url.lower() or "emas" in current_url.lower():
-                self.logger.info("Successfully bypassed trusted device prompt by direct navigation!")
-                return True
-            
-            self.logger.error("Failed to handle trusted device prompt")
-            return False
-            
-        except Exception as e:
-            self.logger.error(f"Error handling trusted device prompt: {e}")
-            return False
-                
-        except Exception as e:
-            self.logger.error(f"Login failed with error: {str(e)}")
+        except WebDriverException as e:
+            self.logger.error(f"Error handling trusted device prompt: {e.msg}")
             return False
+        
+        if "symbol" in current_url.lower() or "emas" in current_url.lower():
+            self.logger.info("Successfully bypassed trusted device prompt by direct navigation!")
+            return True
+        
+        self.logger.error("Failed to handle trusted device prompt")
+        return False
     
     def _navigate_to_symbol(self) -> bool:
         """Navigate to the target symbol page"""
@@ -359,28 +722,12 @@ class StockbitScraper:
             self.logger.info(f"Navigating to symbol page: {self.config.symbol}")
             self.driver.get(self.config.symbol_url)
             
-            # Wait for page to load
-            wait = WebDriverWait(self.driver, 15)
-            
-            # Look for stream section or any indicator that the page loaded
-            stream_indicators = [
-                ".stream-container",
-                ".stream-section", 
-                "[data-testid='stream']",
-                ".post-container",
-                ".comment-container"
-            ]
-            
-            for indicator in stream_indicators:
-                try:
-                    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, indicator)))
-                    self.logger.info("Symbol page loaded successfully")
-                    return True
-                except TimeoutException:
-                    continue
+            # Wait for the stream section or its first post, whichever renders first
+            if self._wait_for_posts(f"{STREAM_INDICATOR_SELECTOR}, {POST_SELECTOR}"):
+                self.logger.info("Symbol page loaded successfully")
+                return True
             
-            # If no specific stream indicators found, just wait a bit and assume success
-            time.sleep(3)
+            # If no stream indicators found, assume success; scrolling waits for content
             self.logger.info("Navigated to symbol page (stream section detection inconclusive)")
             return True
             
@@ -388,6 +735,32 @@ class StockbitScraper:
             self.logger.error(f"Failed to navigate to symbol page: {str(e)}")
             return False
     
+    def _wait_for_posts(self, selector: str = POST_SELECTOR, timeout: int = 15) -> bool:
+        """Wait until an element matching selector is present, returning False on timeout"""
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+            )
+            return True
+        except TimeoutException:
+            return False
+    
+    def _scroll_and_count(self, scroll_js: str) -> int:
+        """Scroll, wait for new content and count posts in a single CDP round trip"""
+        expression = SCROLL_AND_COUNT_JS % {
+            "scroll": scroll_js,
+            "pause_ms": int(self.config.scroll_pause_time * 1000),
+            "selectors": json.dumps(POST_SELECTORS),
+        }
+        response = self.driver.execute_cdp_cmd('Runtime.evaluate', {
+            "expression": expression,
+            "awaitPromise": True,
+            "returnByValue": True,
+        })
+        if "exceptionDetails" in response:
+            raise WebDriverException(f"Scroll script failed: {response['exceptionDetails'].get('text')}")
+        return int(response.get("result", {}).get("value") or 0)
+    
     def _perform_infinite_scroll(self) -> bool:
         """Perform intelligent scrolling until target data count or no new data"""
         try:
@@ -396,20 +769,12 @@ class StockbitScraper:
             scroll_count = 0
             no_new_data_count = 0
             last_data_count = 0
+            scroll_js = "window.scrollTo(0, document.body.scrollHeight);"
             
             while scroll_count < self.config.max_scrolls:
-                # Scroll to bottom
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                
-                # Wait for new content to load
-                time.sleep(self.config.scroll_pause_time)
-                
-                # Extract current data and count
-                current_comments = self._extract_stream_data()
-                current_data_count = len(current_comments)
-                
-                # Update data manager with current data
-                self.data_manager.comments = current_comments
+                # Scroll to bottom and count loaded posts inside the page,
+                # without pulling page_source over the wire
+                current_data_count = self._scroll_and_count(scroll_js)
                 
                 # Check if we've reached target data count
                 if current_data_count >= self.config.target_data_count:
@@ -426,17 +791,16 @@ class StockbitScraper:
                         break
                     
                     # Try scrolling a bit more for stubborn content
-                    self.driver.execute_script(f"window.scrollBy(0, {self.config.scroll_increment});")
-                    time.sleep(self.config.scroll_pause_time)
+                    scroll_js = f"window.scrollBy(0, {self.config.scroll_increment});"
                 else:
                     no_new_data_count = 0
                     scroll_count += 1
                     new_data = current_data_count - last_data_count
-                    self.logger.info(f"Scroll {scroll_count}: Found {new_data} new comments (total: {current_data_count})")
+                    self.logger.info(f"Scroll {scroll_count}: Found {new_data} new posts (total: {current_data_count})")
                     last_data_count = current_data_count
+                    scroll_js = "window.scrollTo(0, document.body.scrollHeight);"
             
-            final_count = len(self.data_manager.comments)
-            self.logger.info(f"Infinite scroll completed after {scroll_count} scrolls with {final_count} comments")
+            self.logger.info(f"Infinite scroll completed after {scroll_count} scrolls with {last_data_count} posts loaded")
             return True
             
         except Exception as e:
@@ -448,268 +812,240 @@ class StockbitScraper:
         if not timestamp_text:
             return None
         
+        timestamp_text = timestamp_text.strip()
+        match = TIMESTAMP_RE.search(timestamp_text)
+        
         try:
-            timestamp_text = timestamp_text.strip()
-            original_text = timestamp_text
-            timestamp_text_lower = timestamp_text.lower()
-            
-            # Handle relative timestamps (e.g., "2h ago", "1d ago")
-            if "ago" in timestamp_text_lower:
-                if "h" in timestamp_text_lower:  # hours ago
-                    match = re.search(r'(\d+)h', timestamp_text_lower)
-                    if match:
-                        hours = int(match.group(1))
-                        return datetime.now() - pd.Timedelta(hours=hours)
-                elif "d" in timestamp_text_lower:  # days ago
-                    match = re.search(r'(\d+)d', timestamp_text_lower)
-                    if match:
-                        days = int(match.group(1))
-                        return datetime.now() - pd.Timedelta(days=days)
-                elif "min" in timestamp_text_lower:  # minutes ago
-                    match = re.search(r'(\d+)', timestamp_text_lower)
-                    if match:
-                        minutes = int(match.group(1))
-                        return datetime.now() - pd.Timedelta(minutes=minutes)
-            
-            # Handle absolute timestamps like "6 Oct 25, 13:20"
-            patterns = [
-                # Pattern for "6 Oct 25, 13:20" format (Indonesian Stockbit format)
-                r'(\d{1,2})\s+(Jan|Feb|Mar|Apr|Mei|Jun|Jul|Agu|Sep|Okt|Nov|Des|Oct|Aug|Dec)\s+(\d{2})[,\s]+(\d{1,2}):(\d{2})',
-                # Standard English patterns
-                r'(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{2,4})[,\s]+(\d{1,2}):(\d{2})',
-                r'(\d{1,2})/(\d{1,2})/(\d{2,4})\s+(\d{1,2}):(\d{2})',
-                r'(\d{4})-(\d{1,2})-(\d{1,2})\s+(\d{1,2}):(\d{2})',
-            ]
-            
-            # Month mapping for both English and Indonesian
-            month_map = {
-                'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Mei': 5, 'Jun': 6,
-                'Jul': 7, 'Aug': 8, 'Agu': 8, 'Sep': 9, 'Oct': 10, 'Okt': 10, 
-                'Nov': 11, 'Dec': 12, 'Des': 12
-            }
-            
-            for pattern in patterns:
-                match = re.search(pattern, timestamp_text, re.IGNORECASE)
-                if match:
-                    try:
-                        groups = match.groups()
-                        if len(groups) >= 5 and groups[1].isalpha():  # Month name pattern
-                            day, month_str, year_str, hour, minute = groups
-                            
-                            month = month_map.get(month_str.capitalize())
-                            if not month:
-                                continue
-                                
-                            year = int(year_str)
-                            # Handle 2-digit year (assume 2000s)
-                            if year < 100:
-                                year += 2000
-                            
-                            return datetime(year, month, int(day), int(hour), int(minute))
-                            
-                    except (ValueError, IndexError) as e:
-                        self.logger.debug(f"Error parsing timestamp {original_text}: {e}")
-                        continue
-            
-            # If no pattern matched, return current time as fallback
-            self.logger.debug(f"Could not parse timestamp, using current time: {original_text}")
-            return datetime.now()
-            
-        except Exception as e:
-            self.logger.debug(f"Exception parsing timestamp {timestamp_text}: {e}")
-            return datetime.now()
+            if match is None:
+                pass
+            elif match.group('rel_n') is not None:
+                # Relative timestamps (e.g., "2h ago", "1d ago", "5 min ago")
+                unit = RELATIVE_UNITS[match.group('rel_u').lower()]
+                return datetime.now() - timedelta(**{unit: int(match.group('rel_n'))})
+            elif match.group('mon') is not None:
+                # Absolute timestamps like "6 Oct 25, 13:20"
+                year = int(match.group('year'))
+                # Handle 2-digit year (assume 2000s)
+                if year < 100:
+                    year += 2000
+                return datetime(year, MONTHS[match.group('mon').capitalize()], int(match.group('day')),
+                                int(match.group('hour')), int(match.group('minute')))
+            else:
+                # ISO-like timestamps such as "2025-10-06 13:20"
+                return datetime(int(match.group('iso_year')), int(match.group('iso_month')),
+                                int(match.group('iso_day')), int(match.group('iso_hour')),
+                                int(match.group('iso_minute')))
+        except ValueError as e:
+            self.logger.debug("Error parsing timestamp %s: %s", timestamp_text, e)
+        
+        # If no pattern matched, return current time as fallback
+        self.logger.debug("Could not parse timestamp, using current time: %s", timestamp_text)
+        return datetime.now()
+    
+    def _extract_via_js(self) -> Optional[List[Dict[str, str]]]:
+        """Collect raw post fields inside the page, returning None if the script fails"""
+        try:
+            rows = self.driver.execute_script(EXTRACT_POSTS_JS, EXTRACT_SELECTORS)
+        except WebDriverException as e:
+            self.logger.warning(f"In-page extraction failed, falling back to page source: {e}")
+            return None
+        return rows if isinstance(rows, list) else None
     
     def _extract_stream_data(self) -> List[StreamComment]:
         """Extract stream comments from the loaded page"""
+        return list(self._iter_stream_data())
+    
+    def _iter_stream_data(self) -> Iterator[StreamComment]:
+        """Yield stream comments from the loaded page one at a time"""
+        count = 0
         try:
             self.logger.info("Extracting stream data from page...")
             
-            # Get page source and parse with BeautifulSoup
-            page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
-            
-            comments = []
-            
-            # Updated selectors based on actual Stockbit HTML structure
-            post_selectors = [
-                'div[data-cy*="stream-post-symbol"]',  # Primary selector from actual HTML
-                '.sc-ad32df5c-8',  # Class from actual HTML
-                'div[data-cy*="stream-post"]',  # More general data-cy selector
-                '.stream-post',  # Fallback
-                '.post-item',  # Fallback
-            ]
-            
-            posts = []
-            for selector in post_selectors:
-                posts = soup.select(selector)
-                if posts:
-                    self.logger.info(f"Found {len(posts)} posts using selector: {selector}")
-                    break
-            
-            if not posts:
-                # Try more generic approach
-                self.logger.warning("No posts found with specific selectors, trying data-cy pattern...")
-                posts = soup.find_all('div', {'data-cy': re.compile(r'stream-post')})
+            # Read only the needed fields in the page instead of serializing
+            # the whole DOM; parse page_source when the script is unavailable
+            rows = self._extract_via_js()
+            if rows is not None:
+                self.logger.info(f"Found {len(rows)} posts in page")
+                comments = self._iter_comments(rows, self._comment_from_fields)
+            else:
+                # Get page source and parse it once (selectolax, or BeautifulSoup fallback)
+                page_source = self.driver.page_source
+                tree = _parse_page(page_source)
+                if tree is None:
+                    self.logger.warning("Page source has no post content, nothing to extract")
+                    return
+                
+                posts = []
+                for selector in POST_SELECTORS:
+                    posts = tree.css(selector)
+                    if posts:
+                        self.logger.info(f"Found {len(posts)} posts using selector: {selector}")
+                        break
+                
+                if not posts:
+                    # Final fallback: look for divs with stream-related classes
+                    self.logger.warning("No posts found with specific selectors, trying class-based fallback...")
+                    posts = tree.css(POST_FALLBACK_SELECTOR)
                 
-            if not posts:
-                # Final fallback: look for divs with stream-related classes
-                self.logger.warning("Still no posts found, trying class-based fallback...")
-                posts = soup.find_all(['div'], class_=re.compile(r'sc-ad32df5c-8|ebbJkf', re.I))
+                comments = self._iter_comments(posts, self._extract_single_comment)
             
-            for post in posts:
-                try:
-                    comment_data = self._extract_single_comment(post)
-                    if comment_data:
-                        comments.append(comment_data)
-                except Exception as e:
-                    self.logger.warning(f"Error extracting single comment: {str(e)}")
-                    continue
+            for comment in comments:
+                count += 1
+                yield comment
             
-            self.logger.info(f"Successfully extracted {len(comments)} comments")
-            return comments
+            self.logger.info(f"Successfully extracted {count} comments")
             
         except Exception as e:
             self.logger.error(f"Error extracting stream data: {str(e)}")
-            return []
+    
+    def _stream_to_file(self) -> int:
+        """Write extracted comments straight to the output file, returning how
+        many were written"""
+        writer = self.data_manager.open_stream(self.config.output_filename, self.config.output_format)
+        try:
+            for comment in self._iter_stream_data():
+                writer.write(comment)
+        finally:
+            count = self.data_manager.close_stream()
+        return count
+    
+    def _iter_comments(self, items: List[Any], build) -> Iterator[StreamComment]:
+        """Yield comments built from posts or in-page rows, on a thread pool when
+        config.extract_workers > 1. Posts are independent, but the parsers hold
+        the GIL, so the gain depends on the host."""
+        def build_one(item):
+            try:
+                return build(item)
+            except Exception as e:
+                self.logger.warning(f"Error extracting single comment: {str(e)}")
+                return None
+        
+        workers = self.config.extract_workers
+        if workers > 1 and len(items) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for comment in executor.map(build_one, items):
+                    if comment:
+                        yield comment
+        else:
+            for item in items:
+                comment = build_one(item)
+                if comment:
+                    yield comment
     
     def _extract_single_comment(self, post_element) -> Optional[StreamComment]:
         """Extract data from a single post/comment element based on actual Stockbit HTML"""
         try:
-            # Extract post ID from data-cy attribute
-            post_id = ""
-            data_cy = post_element.get('data-cy', '')
-            if 'stream-post-symbol-' in data_cy:
-                post_id = data_cy.replace('stream-post-symbol-', '')
-            
-            # Extract username - based on actual HTML structure
-            username = ""
-            # Look for the profile link pattern: a[href*="/username"]
-            username_link = post_element.select_one('a[href*="/"][href$="?source=2"]')
-            if username_link:
-                href = username_link.get('href', '')
-                # Extract username from href like "/adityassatriaa?source=2"
-                if href.startswith('/') and '?' in href:
-                    username = href.split('?')[0][1:]  # Remove leading '/' and query params
-            
-            if not username:
-                # Fallback: look for username in link classes
-                username_elem = post_element.select_one('.sc-ad32df5c-3.kvgQrd')
-                if username_elem:
-                    username = username_elem.get_text(strip=True)
-            
-            # Extract comment text - look for the main content paragraph
-            comment_text = ""
-            # Based on HTML structure: look for p tag in content area
-            content_selectors = [
-                '.sc-7f9f3cba-1.gVgfuQ',  # Specific class from HTML
-                '.sc-8a078c1d-0.sc-7f9f3cba-1',  # More general pattern
-                'p[style*="overflow-wrap"]',  # Paragraph with specific style
-                '.sc-ad32df5c-5 p',  # Paragraph inside content container
-                'p'  # Final fallback
-            ]
-            
-            for selector in content_selectors:
-                content_elem = post_element.select_one(selector)
-                if content_elem:
-                    comment_text = content_elem.get_text(strip=True)
-                    if comment_text:  # Only break if we found actual text
-                        break
-            
-            # Extract timestamp - look for the post link with timestamp
-            timestamp = None
-            timestamp_selectors = [
-                'a[href*="/post/"] .sc-ad32df5c-3.iVkFTS',  # Specific timestamp class
-                'a[href*="/post/"]',  # Post link
-                '.ljSlgm.iVkFTS',  # Timestamp class pattern
-            ]
-            
-            for selector in timestamp_selectors:
-                time_elem = post_element.select_one(selector)
-                if time_elem:
-                    timestamp_text = time_elem.get_text(strip=True)
-                    if timestamp_text and any(char.isdigit() for char in timestamp_text):
-                        timestamp = self._extract_timestamp(timestamp_text)
-                        break
-            
-            # Extract likes count - look for likes info
-            likes = 0
-            like_selectors = [
-                '.likes-info',  # Based on HTML class
-                '.sc-8a078c1d-0.iLZqZP',  # Specific likes class
-                '[data-cy*="like"]',  # Data attribute
-            ]
-            
-            for selector in like_selectors:
-                like_elem = post_element.select_one(selector)
-                if like_elem:
-                    like_text = like_elem.get_text(strip=True)
-                    if like_text:
-                        likes = self._extract_number(like_text)
-                        break
-            
-            # Extract replies/comments count - look for comment icon area
-            replies = 0
-            reply_selectors = [
-                '[data-cy="company-stream-comment-icon"]',  # Based on HTML
-                '.lkviPX',  # Class near comment icon
-                'img[alt="Icon Comment New"]',  # Comment icon
-            ]
-            
-            # Look for text near comment icon that might contain count
-            for selector in reply_selectors:
-                reply_elem = post_element.select_one(selector)
-                if reply_elem:
-                    # Check parent/sibling elements for count text
-                    parent = reply_elem.parent
-                    if parent:
-                        reply_text = parent.get_text(strip=True)
-                        if reply_text and any(char.isdigit() for char in reply_text):
-                            replies = self._extract_number(reply_text)
-                            break
-            
-            # Only create comment if we have essential data
-            if username or comment_text:
-                comment = StreamComment(
-                    username=username,
-                    comment_text=comment_text,
-                    timestamp=timestamp,
-                    likes=likes,
-                    replies=replies,
-                    post_id=post_id
-                )
-                
-                self.logger.debug(f"Extracted comment: {username} - {comment_text[:50]}...")
-                return comment
-            
-            self.logger.debug(f"Skipping post - no username or comment text found")
-            return None
-            
+            return self._comment_from_fields(self._post_fields(post_element))
         except Exception as e:
             self.logger.warning(f"Error extracting single comment: {str(e)}")
             return None
     
+    def _post_fields(self, post_element) -> Dict[str, str]:
+        """Read the raw text fields of a parsed post; mirrors EXTRACT_POSTS_JS"""
+        username_link = post_element.css_first(USERNAME_LINK_SELECTOR)
+        username_elem = post_element.css_first(USERNAME_FALLBACK_SELECTOR)
+        
+        content = ""
+        for selector in CONTENT_SELECTORS:
+            content_elem = post_element.css_first(selector)
+            if content_elem:
+                content = content_elem.text(strip=True)
+                if content:  # Only break if we found actual text
+                    break
+        
+        timestamp = ""
+        for selector in TIMESTAMP_SELECTORS:
+            time_elem = post_element.css_first(selector)
+            if time_elem:
+                timestamp_text = time_elem.text(strip=True)
+                if timestamp_text and HAS_DIGIT_RE.search(timestamp_text):
+                    timestamp = timestamp_text
+                    break
+        
+        likes = ""
+        for selector in LIKE_SELECTORS:
+            like_elem = post_element.css_first(selector)
+            if like_elem:
+                likes = like_elem.text(strip=True)
+                if likes:
+                    break
+        
+        # Look for text near comment icon that might contain count
+        replies = ""
+        for reply_elem in post_element.css(REPLY_SELECTOR):
+            # Check parent element for count text
+            parent = reply_elem.parent
+            if parent:
+                reply_text = parent.text(strip=True)
+                if reply_text and HAS_DIGIT_RE.search(reply_text):
+                    replies = reply_text
+                    break
+        
+        return {
+            'data_cy': post_element.attributes.get('data-cy') or '',
+            'href': (username_link.attributes.get('href') or '') if username_link else '',
+            'user_text': username_elem.text(strip=True) if username_elem else '',
+            'content': content,
+            'timestamp': timestamp,
+            'likes': likes,
+            'replies': replies,
+        }
+    
+    def _comment_from_fields(self, fields: Dict[str, str]) -> Optional[StreamComment]:
+        """Build a comment from raw post fields collected in the page or from parsed HTML"""
+        # Extract post ID from data-cy attribute
+        post_id = ""
+        data_cy = fields['data_cy']
+        if 'stream-post-symbol-' in data_cy:
+            post_id = data_cy.replace('stream-post-symbol-', '')
+        
+        # Extract username from profile href like "/adityassatriaa?source=2"
+        username = ""
+        href = fields['href']
+        if href.startswith('/') and '?' in href:
+            username = href.split('?')[0][1:]  # Remove leading '/' and query params
+        
+        if not username:
+            # Fallback: username text from link classes
+            username = fields['user_text']
+        
+        # Usernames repeat across posts; share one string object per user
+        username = sys.intern(username.strip()) if username else ""
+        comment_text = fields['content'].strip()
+        
+        # Anonymous fragments (stray icons, "..." links) are not comments;
+        # skip them before parsing timestamps and counts
+        if not username and len(comment_text) < 3:
+            self.logger.debug("Skipping post - no username or comment text found")
+            return None
+        
+        timestamp = self._extract_timestamp(fields['timestamp']) if fields['timestamp'] else None
+        likes = self._extract_number(fields['likes'])
+        replies = self._extract_number(fields['replies'])
+        
+        comment = StreamComment(
+            username=username,
+            comment_text=comment_text,
+            timestamp=timestamp,
+            likes=likes,
+            replies=replies,
+            post_id=post_id
+        )
+        
+        self.logger.debug("Extracted comment: %s - %.50s...", username, comment_text)
+        return comment
+    
     def _extract_number(self, text: str) -> int:
         """Extract number from text (handles 1.2K, 1M format)"""
         if not text:
             return 0
         
-        try:
-            # Remove non-digit characters except K, M, decimal point
-            clean_text = re.sub(r'[^\d.KM]', '', text.upper())
-            
-            if 'K' in clean_text:
-                number = float(clean_text.replace('K', ''))
-                return int(number * 1000)
-            elif 'M' in clean_text:
-                number = float(clean_text.replace('M', ''))
-                return int(number * 1000000)
-            else:
-                # Try to extract just the number
-                numbers = re.findall(r'\d+', clean_text)
-                return int(numbers[0]) if numbers else 0
-                
-        except Exception:
+        match = NUMBER_RE.search(text)
+        if not match:
             return 0
+        
+        number = float(match.group(1).replace(',', ''))
+        return int(number * NUMBER_MULTIPLIERS[match.group(2)])
     
     def scrape(self) -> bool:
         """Main scraping method"""
@@ -722,29 +1058,27 @@ class StockbitScraper:
             # Initialize driver
             self.driver = self._init_driver()
             
-            # Perform login
-            if not self._login():
-                return False
-            
-            # Navigate to symbol page
-            if not self._navigate_to_symbol():
-                return False
+            # Reuse saved login cookies when possible, otherwise log in and
+            # navigate to symbol page
+            if not self._restore_session():
+                if not self._login():
+                    return False
+                
+                if not self._navigate_to_symbol():
+                    return False
             
             # Perform infinite scroll
             if not self._perform_infinite_scroll():
                 return False
             
-            # Extract data
-            comments = self._extract_stream_data()
+            # Extract data, writing each comment to the output file as it is built
+            count = self._stream_to_file()
             
-            if not comments:
+            if not count:
                 self.logger.warning("No comments extracted")
                 return False
             
-            # Add to data manager
-            self.data_manager.add_comments(comments)
-            
-            self.logger.info(f"Scraping completed successfully! Collected {len(comments)} comments")
+            self.logger.info(f"Scraping completed successfully! Collected {count} comments")
             return True
             
         except Exception as e:
@@ -757,6 +1091,14 @@ class StockbitScraper:
     
     def save_data(self, filename: Optional[str] = None) -> str:
         """Save scraped data to file"""
+        stream = self.data_manager.stream
+        if stream is not None and not self.data_manager.comments:
+            # Comments were already written while scraping
+            if filename is None or filename == stream.filename:
+                return stream.filename
+            shutil.copyfile(stream.filename, filename)
+            return filename
+        
         if filename is None:
             filename = self.config.output_filename
         
@@ -787,17 +1129,14 @@ class StockbitScraper:
             if not self._perform_infinite_scroll():
                 return False
             
-            # Extract data
-            comments = self._extract_stream_data()
+            # Extract data, writing each comment to the output file as it is built
+            count = self._stream_to_file()
             
-            if not comments:
+            if not count:
                 self.logger.warning("No comments extracted")
                 return False
             
-            # Add to data manager
-            self.data_manager.add_comments(comments)
-            
-            self.logger.info(f"Session scraping completed successfully! Collected {len(comments)} comments")
+            self.logger.info(f"Session scraping completed successfully! Collected {count} comments")
             return True
             
         except Exception as e:
@@ -819,8 +1158,9 @@ class StockbitScraper:
             self.logger.info(f"Navigating to symbol page: {self.config.symbol}")
             self.driver.get(self.config.symbol_url)
             
-            # Wait for page to load
-            time.sleep(5)
+            # Wait for stream posts to render
+            if not self._wait_for_posts():
+                self.logger.warning("No stream posts appeared within 15 seconds")
             
             current_url = self.driver.current_url
             self.logger.info(f"Current URL: {current_url}")
@@ -834,17 +1174,14 @@ class StockbitScraper:
             if not self._perform_infinite_scroll():
                 return False
             
-            # Extract data
-            comments = self._extract_stream_data()
+            # Extract data, writing each comment to the output file as it is built
+            count = self._stream_to_file()
             
-            if not comments:
+            if not count:
                 self.logger.warning("No comments extracted")
                 return False
             
-            # Add to data manager
-            self.data_manager.add_comments(comments)
-            
-            self.logger.info(f"Manual scraping completed successfully! Collected {len(comments)} comments")
+            self.logger.info(f"Manual scraping completed successfully! Collected {count} comments")
             return True
             
         except Exception as e:
@@ -19,8 +19,9 @@ import os
 
 # Import our integrated sentiment analyzer with error handling
 try:
-    sys.path.append(os.path.join(os.path.dirname(__file__), 'src', 'emas_scraper'))
-    from sentiment_analyzer import get_meaningful_words, STOCK_POSITIVE_TERMS, STOCK_NEGATIVE_TERMS
+    # Imported as part of the package, since the module uses relative imports
+    sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+    from emas_scraper.sentiment_analyzer import get_meaningful_words, STOCK_POSITIVE_TERMS, STOCK_NEGATIVE_TERMS
 except ImportError:
     # Fallback if import fails - define basic versions
     def get_meaningful_words(text, min_length=3):
@@ -32,6 +33,20 @@ except ImportError:
     STOCK_POSITIVE_TERMS = {'naik', 'up', 'bullish', 'profit', 'mantap', 'bagus'}
     STOCK_NEGATIVE_TERMS = {'turun', 'down', 'bearish', 'loss', 'rugi', 'jelek'}
 
+# Source data and its parquet cache (rebuilt whenever the CSV is newer)
+DATA_CSV = 'sentiments.csv'
+DATA_CACHE = 'sentiments.parquet'
+
+# Derived columns the cache must carry; a cache written without them is rebuilt
+CACHE_COLUMNS = {'timestamp', 'date', 'hour', 'comment_len', 'meaningful_words'}
+
+# Word cloud colour lookups, lowercased once instead of per rendered word
+POSITIVE_TERMS_LOWER = frozenset(term.lower() for term in STOCK_POSITIVE_TERMS)
+NEGATIVE_TERMS_LOWER = frozenset(term.lower() for term in STOCK_NEGATIVE_TERMS)
+
+# Stock symbols mentioned in comments (e.g., $EMAS, $ANTM)
+SYMBOL_RE = re.compile(r'\$([A-Z]{3,5})')
+
 # Set page config
 st.set_page_config(
     page_title="📊 Enhanced Stock Sentiment Dashboard",
@@ -71,16 +86,89 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+def read_cached_data():
+    """Return the parquet cache of the sentiment data, or None if it is stale or unreadable"""
+    try:
+        if os.path.getmtime(DATA_CACHE) < os.path.getmtime(DATA_CSV):
+            return None
+        df = pd.read_parquet(DATA_CACHE)
+    except (OSError, ImportError, ValueError):
+        # Missing or corrupt cache, or no parquet engine installed
+        return None
+    
+    if not CACHE_COLUMNS.issubset(df.columns):
+        return None
+    # Older caches stored dates as datetime.date objects
+    if not pd.api.types.is_datetime64_any_dtype(df['date']):
+        return None
+    # Older caches were written before the timestamp sort (missing times sort last)
+    if not df['timestamp'].dropna().is_monotonic_increasing:
+        return None
+    return df
+
+def write_cached_data(df):
+    """Write the parsed sentiment data to the parquet cache; caching is best-effort"""
+    try:
+        df.to_parquet(DATA_CACHE, index=False, compression='zstd')
+    except (OSError, ImportError, ValueError):
+        pass
+
+def read_source_data():
+    """Parse the sentiment CSV, with pyarrow's multithreaded reader when installed"""
+    try:
+        from pyarrow import csv as pa_csv
+    except ImportError:
+        return pd.read_csv(DATA_CSV)
+    
+    table = pa_csv.read_csv(
+        DATA_CSV,
+        # Scraped comments may carry quoted line breaks
+        parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+        # Empty fields become missing values, as with pd.read_csv
+        convert_options=pa_csv.ConvertOptions(strings_can_be_null=True)
+    )
+    return table.to_pandas()
+
 @st.cache_data
 def load_data():
     """Load and cache the sentiment data"""
     try:
-        # Load authentic sentiment analysis data
-        df = pd.read_csv('sentiments.csv')
+        df = read_cached_data()
+        if df is None:
+            # Load authentic sentiment analysis data
+            df = read_source_data()
+            
+            # No-op when pyarrow already parsed the ISO timestamps
+            df['timestamp'] = pd.to_datetime(df['timestamp'])
+            # Midnight timestamps rather than datetime.date objects, so date
+            # groupbys stay on datetime64 values
+            df['date'] = df['timestamp'].dt.normalize()
+            df['hour'] = df['timestamp'].dt.hour
+            # Nullable so missing comments stay out of the length stats
+            df['comment_len'] = df['comment_text'].str.len().astype('Int32')
+            # Tokenized once here so the word cloud only sums per-comment bags
+            df['meaningful_words'] = [
+                get_meaningful_words(text, min_length=3)
+                for text in df['comment_text'].fillna('')
+            ]
+            
+            # Timestamp order lets the date filter slice with searchsorted;
+            # sorted before caching so warm loads skip it
+            df = df.sort_values('timestamp', kind='stable').reset_index(drop=True)
+            write_cached_data(df)
         
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        df['date'] = df['timestamp'].dt.date
-        df['hour'] = df['timestamp'].dt.hour
+        # Low-cardinality columns that every chart groups on; categories turn
+        # the groupbys into integer-code lookups. Sentiment casing is normalized
+        # here once so filters compare labels directly.
+        df['sentiment'] = df['sentiment'].str.capitalize().astype('category')
+        df['username'] = df['username'].astype('category')
+        if 'original_sentiment' in df.columns:
+            original = df['original_sentiment'].str.capitalize()
+            df['original_sentiment'] = original
+            # Static per dataset, so the enhancement-impact mask is built once
+            df['sentiment_adjusted'] = (
+                original.notna() & (original != '') & (original != df['sentiment'])
+            )
         
         # Show data info
         st.sidebar.success(f"✅ Loaded {len(df):,} authentic sentiment records")
@@ -93,59 +181,77 @@ def load_data():
         st.error(f"❌ Error loading data: {e}")
         return None
 
-def extract_stock_symbols(text):
-    """Extract stock symbols from text (e.g., $EMAS, $ANTM)"""
-    if pd.isna(text):
-        return []
-    symbols = re.findall(r'\$([A-Z]{3,5})', str(text))
-    return symbols
+def count_meaningful_words(word_bags):
+    """Count meaningful words across comments from their tokenized word bags"""
+    word_freq = Counter()
+    for words in word_bags:
+        word_freq.update(words)
+    return word_freq
+
+@st.cache_data(show_spinner=False)
+def count_stock_symbols(comment_texts):
+    """Count stock symbol mentions across comments, most mentioned first;
+    cached per set of comments"""
+    # One row per mention; comments without symbols explode to NaN
+    symbols = comment_texts.fillna('').str.findall(SYMBOL_RE).explode().dropna().to_numpy()
+    
+    # Integer codes + bincount instead of hashing every mention into a dict;
+    # the stable sort keeps first-mention order for ties, like Counter.most_common
+    codes, uniques = pd.factorize(symbols)
+    counts = np.bincount(codes)
+    order = np.argsort(-counts, kind='stable')
+    return pd.Series(counts[order], index=uniques[order])
+
+def wordcloud_color_func(word, font_size, position, orientation, random_state=None, **kwargs):
+    """Color words by sentiment: stock terms green/red, symbols blue"""
+    lowered = word.lower()
+    if lowered in POSITIVE_TERMS_LOWER:
+        return "green"
+    elif lowered in NEGATIVE_TERMS_LOWER:
+        return "red"
+    elif word.isupper() and len(word) <= 4:  # Stock symbols
+        return "blue"
+    else:
+        return "darkgray"
+
+@st.cache_data(show_spinner=False)
+def render_wordcloud(frequencies, width, height, max_words=200, relative_scaling='auto',
+                     colormap=None, sentiment_colors=False):
+    """Word cloud image for the given word frequencies, cached per frequencies and
+    layout. Each render builds its own WordCloud, since generate_from_frequencies
+    overwrites the instance's layout and sessions must not share one."""
+    wordcloud = WordCloud(
+        width=width,
+        height=height,
+        background_color='white',
+        max_words=max_words,
+        relative_scaling=relative_scaling,
+        colormap=colormap,
+        color_func=wordcloud_color_func if sentiment_colors else None,
+        font_path=None
+    )
+    return wordcloud.generate_from_frequencies(frequencies).to_array()
 
 def create_enhanced_wordcloud(df, sentiment_filter=None):
     """Create word cloud with meaningful words only."""
     # Filter by sentiment if specified
     if sentiment_filter and sentiment_filter != "All":
-        filtered_df = df[df['sentiment'].str.capitalize() == sentiment_filter.capitalize()]
+        filtered_df = df[df['sentiment'] == sentiment_filter]
     else:
         filtered_df = df
     
     if filtered_df.empty:
         return None
     
-    # Combine all comment texts
-    all_text = ' '.join(filtered_df['comment_text'].astype(str))
-    
-    # Get meaningful words using our enhancer
-    meaningful_words = get_meaningful_words(all_text, min_length=3)
+    # Count word frequencies
+    word_freq = count_meaningful_words(filtered_df['meaningful_words'])
     
-    if not meaningful_words:
+    if not word_freq:
         return None
     
-    # Count word frequencies
-    word_freq = Counter(meaningful_words)
-    
-    # Create color function based on sentiment
-    def color_func(word, font_size, position, orientation, random_state=None, **kwargs):
-        if word.lower() in STOCK_POSITIVE_TERMS:
-            return "green"
-        elif word.lower() in STOCK_NEGATIVE_TERMS:
-            return "red"
-        elif word.isupper() and len(word) <= 4:  # Stock symbols
-            return "blue"
-        else:
-            return "darkgray"
-    
     # Generate word cloud
-    wordcloud = WordCloud(
-        width=800, 
-        height=400, 
-        background_color='white',
-        max_words=100,
-        relative_scaling=0.5,
-        color_func=color_func,
-        font_path=None
-    ).generate_from_frequencies(word_freq)
-    
-    return wordcloud
+    return render_wordcloud(dict(word_freq), 800, 400, max_words=100, relative_scaling=0.5,
+                            sentiment_colors=True)
 
 def main():
     # Header
@@ -163,29 +269,41 @@ def main():
     st.sidebar.header("🔧 Filters")
     
     # Date range filter
+    # The widget works in datetime.date; convert only at this boundary
+    first_date = df['date'].min().date()
+    last_date = df['date'].max().date()
     date_range = st.sidebar.date_input(
         "Select Date Range",
-        value=(df['date'].min(), df['date'].max()),
-        min_value=df['date'].min(),
-        max_value=df['date'].max()
+        value=(first_date, last_date),
+        min_value=first_date,
+        max_value=last_date
     )
     
     # Sentiment filter
     sentiment_filter = st.sidebar.multiselect(
         "Select Sentiments",
-        options=df['sentiment'].unique(),
-        default=df['sentiment'].unique()
+        options=df['sentiment'].unique().tolist(),
+        default=df['sentiment'].unique().tolist()
     )
     
     # Filter data
     if len(date_range) == 2:
-        filtered_df = df[
-            (df['date'] >= date_range[0]) & 
-            (df['date'] <= date_range[1]) &
-            (df['sentiment'].isin(sentiment_filter))
-        ]
+        # Rows are sorted by timestamp, so the date range is one contiguous slice
+        timestamps = df['timestamp'].to_numpy()
+        start = np.searchsorted(timestamps, np.datetime64(date_range[0]))
+        end = np.searchsorted(timestamps, np.datetime64(date_range[1]) + np.timedelta64(1, 'D'))
+        date_df = df.iloc[start:end]
     else:
-        filtered_df = df[df['sentiment'].isin(sentiment_filter)]
+        date_df = df
+    filtered_df = date_df[date_df['sentiment'].isin(sentiment_filter)]
+    
+    # Sentiment counts, shared by the metrics and the distribution charts
+    sentiment_counts = filtered_df['sentiment'].value_counts()
+    # Categorical counts include sentiments filtered out of the selection
+    sentiment_counts = sentiment_counts[sentiment_counts > 0]
+    total_comments = len(filtered_df)
+    # Shares of the selection in percent; empty when nothing is selected
+    sentiment_pcts = sentiment_counts / max(total_comments, 1) * 100
     
     # Main metrics
     col1, col2, col3, col4 = st.columns(4)
@@ -193,25 +311,25 @@ def main():
     with col1:
         st.metric(
             label="📝 Total Comments", 
-            value=len(filtered_df)
+            value=total_comments
         )
     
     with col2:
-        positive_pct = (filtered_df['sentiment'] == 'Positive').mean() * 100
+        positive_pct = sentiment_pcts.get('Positive', 0.0)
         st.metric(
             label="😊 Positive %", 
             value=f"{positive_pct:.1f}%"
         )
     
     with col3:
-        negative_pct = (filtered_df['sentiment'] == 'Negative').mean() * 100
+        negative_pct = sentiment_pcts.get('Negative', 0.0)
         st.metric(
             label="😞 Negative %", 
             value=f"{negative_pct:.1f}%"
         )
     
     with col4:
-        neutral_pct = (filtered_df['sentiment'] == 'Neutral').mean() * 100
+        neutral_pct = sentiment_pcts.get('Neutral', 0.0)
         st.metric(
             label="😐 Neutral %", 
             value=f"{neutral_pct:.1f}%"
@@ -225,45 +343,65 @@ def main():
     
     with col1:
         st.subheader("🥧 Sentiment Distribution")
-        sentiment_counts = filtered_df['sentiment'].value_counts()
         colors = {'Positive': '#28a745', 'Negative': '#dc3545', 'Neutral': '#6c757d'}
         
-        fig_pie = px.pie(
-            values=sentiment_counts.values,
-            names=sentiment_counts.index,
-            title="Overall Sentiment Distribution",
-            color=sentiment_counts.index,
-            color_discrete_map=colors
-        )
-        fig_pie.update_traces(textposition='inside', textinfo='percent+label')
+        # Figures are built from the aggregated arrays directly; Plotly Express
+        # would first re-infer a long-form frame from them
+        sentiment_labels = sentiment_counts.index.to_numpy(dtype=object)
+        sentiment_colors = [colors.get(label) for label in sentiment_labels]
+        
+        fig_pie = go.Figure(go.Pie(
+            values=sentiment_counts.to_numpy(),
+            labels=sentiment_labels,
+            marker=dict(colors=sentiment_colors),
+            textposition='inside',
+            textinfo='percent+label'
+        ))
+        fig_pie.update_layout(title="Overall Sentiment Distribution")
         st.plotly_chart(fig_pie, use_container_width=True)
     
     with col2:
         st.subheader("📊 Sentiment Bar Chart")
-        fig_bar = px.bar(
-            x=sentiment_counts.index,
-            y=sentiment_counts.values,
-            title="Sentiment Count",
-            color=sentiment_counts.index,
-            color_discrete_map=colors,
-            labels={'x': 'Sentiment', 'y': 'Count'}
-        )
+        fig_bar = go.Figure(go.Bar(
+            x=sentiment_labels,
+            y=sentiment_counts.to_numpy(),
+            marker_color=sentiment_colors
+        ))
+        fig_bar.update_layout(title="Sentiment Count", xaxis_title="Sentiment", yaxis_title="Count")
         st.plotly_chart(fig_bar, use_container_width=True)
     
     # Time series analysis
     st.subheader("⏰ Sentiment Over Time")
     
-    # Group by date and sentiment
-    daily_sentiment = filtered_df.groupby(['date', 'sentiment']).size().reset_index(name='count')
+    # Count comments per (date, hour) x sentiment once; the daily and hourly
+    # views below are aggregated from this table
+    sentiment_by_date_hour = pd.crosstab(
+        [filtered_df['date'], filtered_df['hour']], filtered_df['sentiment']
+    )
     
-    fig_timeline = px.line(
-        daily_sentiment,
-        x='date',
-        y='count',
-        color='sentiment',
+    # Daily counts, one column per sentiment
+    daily_counts = sentiment_by_date_hour.groupby(level='date').sum()
+    
+    # WebGL traces keep long date ranges responsive in the browser
+    fig_timeline = go.Figure()
+    for sentiment in daily_counts.columns:
+        # Days without comments of this sentiment are left out of its line
+        sentiment_daily = daily_counts[sentiment]
+        sentiment_daily = sentiment_daily[sentiment_daily > 0]
+        if sentiment_daily.empty:
+            continue
+        fig_timeline.add_trace(go.Scattergl(
+            x=sentiment_daily.index.to_numpy(),
+            y=sentiment_daily.to_numpy(),
+            mode='lines',
+            name=sentiment,
+            line=dict(color=colors.get(sentiment))
+        ))
+    fig_timeline.update_layout(
         title="Daily Sentiment Trends",
-        color_discrete_map=colors,
-        labels={'date': 'Date', 'count': 'Number of Comments'}
+        xaxis_title="Date",
+        yaxis_title="Number of Comments",
+        legend_title_text="sentiment"
     )
     st.plotly_chart(fig_timeline, use_container_width=True)
     
@@ -272,20 +410,20 @@ def main():
     
     with col1:
         st.subheader("🕐 Comments by Hour")
-        hourly_data = filtered_df.groupby('hour').size().reset_index(name='count')
+        hourly_data = sentiment_by_date_hour.groupby(level='hour').sum().sum(axis=1)
         
-        fig_hourly = px.bar(
-            hourly_data,
-            x='hour',
-            y='count',
+        fig_hourly = go.Figure(go.Bar(x=hourly_data.index.to_numpy(), y=hourly_data.to_numpy()))
+        fig_hourly.update_layout(
             title="Comment Distribution by Hour of Day",
-            labels={'hour': 'Hour of Day', 'count': 'Number of Comments'}
+            xaxis_title="Hour of Day",
+            yaxis_title="Number of Comments"
         )
         st.plotly_chart(fig_hourly, use_container_width=True)
     
     with col2:
         st.subheader("🕐 Sentiment by Hour")
-        hourly_sentiment = filtered_df.groupby(['hour', 'sentiment']).size().reset_index(name='count')
+        hourly_counts = sentiment_by_date_hour.groupby(level='hour').sum().stack()
+        hourly_sentiment = hourly_counts[hourly_counts > 0].reset_index(name='count')
         
         fig_hourly_sentiment = px.bar(
             hourly_sentiment,
@@ -299,42 +437,32 @@ def main():
         st.plotly_chart(fig_hourly_sentiment, use_container_width=True)
     
     # Stock symbols analysis
-    st.header("💰 Stock Symbols Analysis")
-    
-    # Extract stock symbols
-    filtered_df['stock_symbols'] = filtered_df['comment_text'].apply(extract_stock_symbols)
-    
-    # Flatten the list of symbols
-    all_symbols = []
-    for symbols in filtered_df['stock_symbols']:
-        all_symbols.extend(symbols)
-    
-    if all_symbols:
-        symbol_counts = Counter(all_symbols)
-        top_symbols = dict(symbol_counts.most_common(10))
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("🏆 Top Mentioned Stocks")
-            fig_stocks = px.bar(
-                x=list(top_symbols.keys()),
-                y=list(top_symbols.values()),
-                title="Most Mentioned Stock Symbols",
-                labels={'x': 'Stock Symbol', 'y': 'Mentions'}
-            )
-            st.plotly_chart(fig_stocks, use_container_width=True)
+    with st.expander("💰 Stock Symbols Analysis", expanded=False):
+        # Extract stock symbols
+        symbol_counts = count_stock_symbols(filtered_df['comment_text'])
         
-        with col2:
-            st.subheader("📈 Stock Symbol Word Cloud")
-            symbol_text = ' '.join([f"${symbol}" for symbol in all_symbols])
-            if symbol_text:
-                wordcloud_stocks = WordCloud(
-                    width=400, 
-                    height=300, 
-                    background_color='white',
-                    colormap='plasma'
-                ).generate(symbol_text)
+        if not symbol_counts.empty:
+            top_symbols = symbol_counts.head(10)
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.subheader("🏆 Top Mentioned Stocks")
+                fig_stocks = go.Figure(go.Bar(
+                    x=top_symbols.index.to_numpy(dtype=object),
+                    y=top_symbols.to_numpy()
+                ))
+                fig_stocks.update_layout(
+                    title="Most Mentioned Stock Symbols",
+                    xaxis_title="Stock Symbol",
+                    yaxis_title="Mentions"
+                )
+                st.plotly_chart(fig_stocks, use_container_width=True)
+            
+            with col2:
+                st.subheader("📈 Stock Symbol Word Cloud")
+                # Counts are already there; generate() would only re-tokenize them
+                wordcloud_stocks = render_wordcloud(symbol_counts.to_dict(), 400, 300, colormap='plasma')
                 
                 fig_wc_stocks = plt.figure(figsize=(8, 6))
                 plt.imshow(wordcloud_stocks, interpolation='bilinear')
@@ -342,140 +470,149 @@ def main():
                 st.pyplot(fig_wc_stocks)
     
     # Enhanced Word Cloud Section
-    st.header("☁️ Enhanced Word Cloud Analysis (Meaningful Words Only)")
-    
-    col1, col2 = st.columns([3, 1])
-    
-    with col2:
-        wordcloud_sentiment_filter = st.selectbox(
-            "Word Cloud Sentiment Filter",
-            ["All", "Positive", "Negative", "Neutral"],
-            key="wordcloud_filter"
-        )
-    
-    with col1:
-        try:
-            wordcloud = create_enhanced_wordcloud(filtered_df, wordcloud_sentiment_filter)
-            if wordcloud:
-                fig, ax = plt.subplots(figsize=(12, 6))
-                ax.imshow(wordcloud, interpolation='bilinear')
-                ax.axis('off')
-                ax.set_title(f'Enhanced Word Cloud - {wordcloud_sentiment_filter} Sentiment', fontsize=16, pad=20)
-                st.pyplot(fig)
-                plt.close()
-                
-                st.info("🎨 **Color Legend:** Green = Positive stock terms, Red = Negative stock terms, Blue = Stock symbols, Gray = General terms")
+    with st.expander("☁️ Enhanced Word Cloud Analysis (Meaningful Words Only)", expanded=False):
+        col1, col2 = st.columns([3, 1])
+        
+        with col2:
+            wordcloud_sentiment_filter = st.selectbox(
+                "Word Cloud Sentiment Filter",
+                ["All", "Positive", "Negative", "Neutral"],
+                key="wordcloud_filter"
+            )
+            generate_wordcloud = st.checkbox("Generate word cloud", key="wordcloud_generate")
+        
+        with col1:
+            # Rendering is the slowest part of the page; only do it on request
+            if not generate_wordcloud:
+                st.info("☁️ Tick **Generate word cloud** to render it for the current selection.")
             else:
-                st.warning("No meaningful words found for the selected filter.")
-        except Exception as e:
-            st.error(f"Error creating word cloud: {e}")
+                try:
+                    wordcloud = create_enhanced_wordcloud(filtered_df, wordcloud_sentiment_filter)
+                    if wordcloud is not None:
+                        fig, ax = plt.subplots(figsize=(12, 6))
+                        ax.imshow(wordcloud, interpolation='bilinear')
+                        ax.axis('off')
+                        ax.set_title(f'Enhanced Word Cloud - {wordcloud_sentiment_filter} Sentiment', fontsize=16, pad=20)
+                        st.pyplot(fig)
+                        plt.close()
+                        
+                        st.info("🎨 **Color Legend:** Green = Positive stock terms, Red = Negative stock terms, Blue = Stock symbols, Gray = General terms")
+                    else:
+                        st.warning("No meaningful words found for the selected filter.")
+                except Exception as e:
+                    st.error(f"Error creating word cloud: {e}")
     
     # Top Users Analysis
-    st.header("👥 User Analysis")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.subheader("🏆 Most Active Users")
-        top_users = filtered_df['username'].value_counts().head(10)
+    with st.expander("👥 User Analysis", expanded=False):
+        col1, col2 = st.columns(2)
         
-        fig_users = px.bar(
-            x=top_users.values,
-            y=top_users.index,
-            orientation='h',
-            title="Top 10 Most Active Users",
-            labels={'x': 'Number of Comments', 'y': 'Username'}
-        )
-        st.plotly_chart(fig_users, use_container_width=True)
-    
-    with col2:
-        st.subheader("😊 User Sentiment Distribution")
-        user_sentiment = filtered_df.groupby(['username', 'sentiment']).size().reset_index(name='count')
-        top_users_list = filtered_df['username'].value_counts().head(5).index
-        user_sentiment_top = user_sentiment[user_sentiment['username'].isin(top_users_list)]
+        with col1:
+            st.subheader("🏆 Most Active Users")
+            user_counts = filtered_df['username'].value_counts()
+            top_users = user_counts.head(10)
+            top_users = top_users[top_users > 0]
+            
+            fig_users = go.Figure(go.Bar(
+                x=top_users.to_numpy(),
+                y=top_users.index.to_numpy(dtype=object),
+                orientation='h'
+            ))
+            fig_users.update_layout(
+                title="Top 10 Most Active Users",
+                xaxis_title="Number of Comments",
+                yaxis_title="Username"
+            )
+            st.plotly_chart(fig_users, use_container_width=True)
         
-        fig_user_sentiment = px.bar(
-            user_sentiment_top,
-            x='username',
-            y='count',
-            color='sentiment',
-            title="Sentiment Distribution - Top 5 Users",
-            color_discrete_map=colors
-        )
-        fig_user_sentiment.update_xaxes(tickangle=45)
-        st.plotly_chart(fig_user_sentiment, use_container_width=True)
+        with col2:
+            st.subheader("😊 User Sentiment Distribution")
+            # Narrow to the top 5 users before grouping rather than after
+            top_users_list = top_users.head(5).index
+            top_user_comments = filtered_df[filtered_df['username'].isin(top_users_list)]
+            user_sentiment_top = top_user_comments.groupby(['username', 'sentiment'], observed=True).size().reset_index(name='count')
+            
+            fig_user_sentiment = px.bar(
+                user_sentiment_top,
+                x='username',
+                y='count',
+                color='sentiment',
+                title="Sentiment Distribution - Top 5 Users",
+                color_discrete_map=colors
+            )
+            fig_user_sentiment.update_xaxes(tickangle=45)
+            st.plotly_chart(fig_user_sentiment, use_container_width=True)
     
     # Stock-Specific Enhancement Analysis Section
-    st.header("🏛️ Stock-Specific Enhancement Analysis")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Show stock terms analysis if columns exist
-        if 'stock_terms_found' in filtered_df.columns:
-            stock_comments = filtered_df[filtered_df['stock_terms_found'].notna() & (filtered_df['stock_terms_found'] != '')]
-            
-            if not stock_comments.empty:
-                st.subheader("🔍 Stock Terms Analysis")
-                st.metric(
-                    "Comments with Stock Terms",
-                    len(stock_comments),
-                    f"{len(stock_comments)/len(filtered_df)*100:.1f}% of total"
-                )
-                
-                # Show most common stock terms
-                all_terms = []
-                for terms_str in stock_comments['stock_terms_found'].dropna():
-                    if terms_str:
-                        all_terms.extend([term.strip() for term in terms_str.split(',') if term.strip()])
+    with st.expander("🏛️ Stock-Specific Enhancement Analysis", expanded=False):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Show stock terms analysis if columns exist
+            if 'stock_terms_found' in filtered_df.columns:
+                stock_comments = filtered_df[filtered_df['stock_terms_found'].notna() & (filtered_df['stock_terms_found'] != '')]
                 
-                if all_terms:
-                    term_counts = Counter(all_terms)
-                    st.write("**Most Common Stock Terms:**")
-                    for term, count in term_counts.most_common(5):
-                        st.write(f"• {term}: {count} times")
+                if not stock_comments.empty:
+                    st.subheader("🔍 Stock Terms Analysis")
+                    st.metric(
+                        "Comments with Stock Terms",
+                        len(stock_comments),
+                        f"{len(stock_comments)/len(filtered_df)*100:.1f}% of total"
+                    )
+                    
+                    # Show most common stock terms
+                    all_terms = []
+                    for terms_str in stock_comments['stock_terms_found'].dropna():
+                        if terms_str:
+                            all_terms.extend([term.strip() for term in terms_str.split(',') if term.strip()])
+                    
+                    if all_terms:
+                        term_counts = Counter(all_terms)
+                        st.write("**Most Common Stock Terms:**")
+                        for term, count in term_counts.most_common(5):
+                            st.write(f"• {term}: {count} times")
+                else:
+                    st.info("No stock-specific terms detected in comments.")
             else:
-                st.info("No stock-specific terms detected in comments.")
-        else:
-            st.info("Stock terms analysis not available. Please run enhanced sentiment analysis.")
-    
-    with col2:
-        # Show enhancement impact if columns exist
-        if 'original_sentiment' in filtered_df.columns:
-            changed_comments = filtered_df[
-                (filtered_df['original_sentiment'].notna()) & 
-                (filtered_df['original_sentiment'] != '') & 
-                (filtered_df['original_sentiment'].str.capitalize() != filtered_df['sentiment'])
-            ]
-            
-            if not changed_comments.empty:
-                st.subheader("🔄 Sentiment Enhancement Impact")
-                st.metric(
-                    "Comments Adjusted",
-                    len(changed_comments),
-                    f"{len(changed_comments)/len(filtered_df)*100:.1f}% of total"
-                )
-                
-                # Show adjustment patterns
-                adjustment_patterns = changed_comments.groupby(['original_sentiment', 'sentiment']).size().reset_index(name='count')
+                st.info("Stock terms analysis not available. Please run enhanced sentiment analysis.")
+        
+        with col2:
+            # Show enhancement impact if columns exist
+            if 'original_sentiment' in filtered_df.columns:
+                changed_comments = filtered_df[filtered_df['sentiment_adjusted']]
                 
-                if not adjustment_patterns.empty:
-                    st.write("**Adjustment Patterns:**")
-                    for _, row in adjustment_patterns.iterrows():
-                        st.write(f"• {row['original_sentiment']} → {row['sentiment']}: {row['count']} comments")
+                if not changed_comments.empty:
+                    st.subheader("🔄 Sentiment Enhancement Impact")
+                    st.metric(
+                        "Comments Adjusted",
+                        len(changed_comments),
+                        f"{len(changed_comments)/len(filtered_df)*100:.1f}% of total"
+                    )
+                    
+                    # Show adjustment patterns
+                    adjustment_patterns = changed_comments.groupby(['original_sentiment', 'sentiment'], observed=True).size().reset_index(name='count')
+                    
+                    if not adjustment_patterns.empty:
+                        st.write("**Adjustment Patterns:**")
+                        for _, row in adjustment_patterns.iterrows():
+                            st.write(f"• {row['original_sentiment']} → {row['sentiment']}: {row['count']} comments")
+                else:
+                    st.info("No sentiment adjustments were made by the stock-specific enhancement.")
             else:
-                st.info("No sentiment adjustments were made by the stock-specific enhancement.")
-        else:
-            st.info("Enhancement impact analysis not available. Please run enhanced sentiment analysis.")
+                st.info("Enhancement impact analysis not available. Please run enhanced sentiment analysis.")
     
     # Sample Comments Section
     st.header("💬 Sample Comments")
     
     sentiment_tabs = st.tabs(["😊 Positive", "😞 Negative", "😐 Neutral"])
     
+    # Newest 10 comments of every sentiment in one pass; the frame is sorted
+    # oldest-first for the date filter, so take the tail and reverse it
+    samples = filtered_df.groupby('sentiment', observed=True).tail(10).iloc[::-1]
+    samples_by_sentiment = dict(tuple(samples.groupby('sentiment', observed=True)))
+    
     for i, sentiment in enumerate(['Positive', 'Negative', 'Neutral']):
         with sentiment_tabs[i]:
-            sentiment_comments = filtered_df[filtered_df['sentiment'] == sentiment].head(10)
+            sentiment_comments = samples_by_sentiment.get(sentiment, samples.iloc[:0])
             
             if not sentiment_comments.empty:
                 for _, comment in sentiment_comments.iterrows():
@@ -508,11 +645,11 @@ def main():
         st.subheader("📊 Basic Stats")
         st.write(f"**Total Comments:** {len(filtered_df):,}")
         st.write(f"**Unique Users:** {filtered_df['username'].nunique():,}")
-        st.write(f"**Date Range:** {filtered_df['date'].min()} to {filtered_df['date'].max()}")
+        st.write(f"**Date Range:** {filtered_df['date'].min().date()} to {filtered_df['date'].max().date()}")
         
     with col2:
         st.subheader("💭 Comment Length Stats")
-        comment_lengths = filtered_df['comment_text'].str.len()
+        comment_lengths = filtered_df['comment_len']
         st.write(f"**Average Length:** {comment_lengths.mean():.1f} characters")
         st.write(f"**Median Length:** {comment_lengths.median():.1f} characters")
         st.write(f"**Max Length:** {comment_lengths.max()} characters")
@@ -520,8 +657,8 @@ def main():
     with col3:
         st.subheader("🎯 Sentiment Summary")
         for sentiment in ['Positive', 'Negative', 'Neutral']:
-            count = len(filtered_df[filtered_df['sentiment'] == sentiment])
-            percentage = (count / len(filtered_df)) * 100
+            count = sentiment_counts.get(sentiment, 0)
+            percentage = sentiment_pcts.get(sentiment, 0.0)
             st.write(f"**{sentiment}:** {count:,} ({percentage:.1f}%)")
 
 if __name__ == "__main__":
@@ -7,6 +7,7 @@ from emas_scraper.config import SearchConfig
 from emas_scraper.google_news import (
     NewsItem,
     build_search_url,
+    _get_session,
     fetch,
     parse_google_news_rss,
     search_google_news
@@ -93,6 +94,56 @@ def test_parse_google_news_rss_max_items():
     assert items[1].title == "News 2"
 
 
+def test_parse_google_news_rss_stdlib_fallback():
+    """Test RSS parsing without lxml stops at max_items and rejects invalid XML."""
+    mock_rss = """<?xml version="1.0" encoding="UTF-8"?>
+    <rss version="2.0">
+        <channel>
+            <item><title>News 1</title><link>https://example.com/1</link></item>
+            <item><title>News 2</title><link>https://example.com/2</link></item>
+            <item><title>News 3</title><link>https://example.com/3</link></item>
+        </channel>
+    </rss>"""
+    
+    with patch('emas_scraper.google_news.etree', None), \
+            patch('emas_scraper.google_news.REGEX_FEED_MAX_CHARS', 0):
+        items = parse_google_news_rss(mock_rss, max_items=2)
+        assert [item.title for item in items] == ["News 1", "News 2"]
+        assert items[0].source == "example.com"
+        
+        assert parse_google_news_rss("invalid xml", max_items=10) == []
+
+
+def test_parse_google_news_rss_regex_matches_parser():
+    """Test the regex fast path agrees with the XML parser and CDATA feeds use the parser."""
+    mock_rss = """<?xml version="1.0" encoding="UTF-8"?>
+    <rss version="2.0">
+        <channel>
+            <title>Google News</title>
+            <item>
+                <title>Saham &amp;lt;EMAS&amp;gt; &amp; emas</title>
+                <link>https://example.com/1?a=1&amp;b=2</link>
+                <pubDate>Sat, 05 Oct 2025 10:00:00 GMT</pubDate>
+                <source url="https://example.com">Kontan &amp; Co</source>
+            </item>
+            <item><title>No link</title></item>
+            <item><title>News 2</title><link>https://www.test.com/2</link></item>
+        </channel>
+    </rss>"""
+    
+    fast = parse_google_news_rss(mock_rss, max_items=10)
+    with patch('emas_scraper.google_news.REGEX_FEED_MAX_CHARS', 0):
+        parsed = parse_google_news_rss(mock_rss, max_items=10)
+    assert fast == parsed
+    assert fast[0].title == "Saham <EMAS> & emas"
+    assert fast[0].url == "https://example.com/1?a=1&b=2"
+    assert fast[0].source == "Kontan & Co"
+    assert fast[1].source == "test.com"
+    
+    cdata_rss = mock_rss.replace("<title>News 2</title>", "<title><![CDATA[News <2>]]></title>")
+    assert parse_google_news_rss(cdata_rss, max_items=10)[1].title == "News <2>"
+
+
 def test_parse_google_news_rss_empty():
     """Test RSS parsing with empty/invalid content."""
     items = parse_google_news_rss("", max_items=10)
@@ -102,12 +153,13 @@ def test_parse_google_news_rss_empty():
     assert len(items) == 0
 
 
-@patch('emas_scraper.google_news.requests.get')
-def test_fetch_success(mock_get):
+@patch('emas_scraper.google_news._get_session')
+def test_fetch_success(mock_get_session):
     """Test successful HTTP fetch."""
     mock_response = Mock()
     mock_response.text = "test content"
     mock_response.raise_for_status.return_value = None
+    mock_get = mock_get_session.return_value.get
     mock_get.return_value = mock_response
     
     content = fetch("https://example.com", "test-agent", 30)
@@ -120,16 +172,25 @@ def test_fetch_success(mock_get):
     )
 
 
-@patch('emas_scraper.google_news.requests.get')
-def test_fetch_timeout(mock_get):
+@patch('emas_scraper.google_news._get_session')
+def test_fetch_timeout(mock_get_session):
     """Test HTTP fetch timeout handling."""
     import requests
-    mock_get.side_effect = requests.exceptions.Timeout()
+    mock_get_session.return_value.get.side_effect = requests.exceptions.Timeout()
     
     with pytest.raises(requests.exceptions.Timeout):
         fetch("https://example.com", "test-agent", 30)
 
 
+def test_get_session_is_shared():
+    """Test fetches reuse one HTTP session."""
+    _get_session.cache_clear()
+    try:
+        assert _get_session() is _get_session()
+    finally:
+        _get_session.cache_clear()
+
+
 @patch('emas_scraper.google_news.fetch')
 @patch('emas_scraper.google_news.parse_google_news_rss')
 def test_search_google_news_integration(mock_parse, mock_fetch):
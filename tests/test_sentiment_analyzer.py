@@ -1,6 +1,11 @@
 """Tests for sentiment analysis module."""
+import dataclasses
 import json
+import pickle
+import subprocess
+import sys
 import tempfile
+from io import BytesIO
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -11,12 +16,42 @@ from emas_scraper.sentiment_analyzer import (
     IndonesianSentimentAnalyzer,
     NewsArticle,
     SentimentResult,
+    TracedClassifier,
+    _load_shared_analyzer,
     analyze_news_sentiment,
+    analyze_sentiment_batch,
     create_analysis_report,
-    load_news_data
+    get_meaningful_words,
+    iter_sentiment_results,
+    load_news_data,
+    scrape_and_analyze,
+    scrape_and_report,
+    write_analysis_report
 )
 
 
+@pytest.fixture(autouse=True)
+def reset_shared_analyzer():
+    """Drop the shared analyzer so each test sees its own patched class."""
+    _load_shared_analyzer.cache_clear()
+    yield
+    _load_shared_analyzer.cache_clear()
+
+
+def test_import_defers_heavy_dependencies():
+    """Test importing the module does not pull in pandas, torch or transformers."""
+    src_dir = Path(__file__).resolve().parents[1] / "src"
+    code = (
+        "import sys, emas_scraper.sentiment_analyzer; "
+        "print(sorted(m for m in ('pandas', 'torch', 'transformers') if m in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], cwd=src_dir, capture_output=True, text=True, check=True
+    ).stdout
+    
+    assert output.strip() == "[]"
+
+
 def test_sentiment_result_from_score():
     """Test SentimentResult creation from scores."""
     # Positive sentiment
@@ -38,6 +73,26 @@ def test_sentiment_result_from_score():
     assert result.confidence == "low"
 
 
+def test_sentiment_result_from_scores_matches_from_score():
+    """Test vectorized SentimentResult creation agrees with from_score."""
+    scores = [0.8, -0.6, 0.05, -0.1, 0.1, 0.7, -0.4, 0.0]
+    
+    assert SentimentResult.from_scores(scores) == [SentimentResult.from_score(s) for s in scores]
+    assert SentimentResult.from_scores([]) == []
+
+
+def test_result_dataclasses_are_frozen_and_picklable():
+    """Test results are immutable and survive the process-pool round trip."""
+    result = SentimentResult.from_scores([0.9])[0]
+    
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result.label = "negative"
+    assert pickle.loads(pickle.dumps(result)) == result
+    assert result.label is sys.intern("positive")
+    if sys.version_info >= (3, 10):
+        assert not hasattr(result, "__dict__")
+
+
 def test_news_article():
     """Test NewsArticle dataclass."""
     article = NewsArticle(
@@ -83,12 +138,34 @@ def test_load_news_data():
         temp_path.unlink()
 
 
+@pytest.mark.parametrize("wrap", [bytes, bytearray, BytesIO])
+def test_load_news_data_from_memory(wrap):
+    """Test loading news data from JSON bytes and binary streams."""
+    payload = json.dumps([
+        {"title": "Berita EMAS", "url": "https://example.com", "source": "Kontan"}
+    ]).encode('utf-8')
+    
+    articles = load_news_data(wrap(payload))
+    assert len(articles) == 1
+    assert articles[0].title == "Berita EMAS"
+    assert articles[0].publication_date is None
+
+
 def test_load_news_data_invalid_file():
     """Test loading news data from non-existent file."""
     articles = load_news_data(Path("non_existent.json"))
     assert len(articles) == 0
 
 
+@pytest.mark.parametrize("content", ["not json", '{"title": "Not a list"}', "[1, 2]"])
+def test_load_news_data_malformed_file(tmp_path, content):
+    """Test loading news data from invalid or unexpected JSON."""
+    path = tmp_path / "news.json"
+    path.write_text(content, encoding="utf-8")
+    
+    assert load_news_data(path) == []
+
+
 @patch('transformers.AutoTokenizer')
 @patch('transformers.AutoModelForSequenceClassification')
 def test_indonesian_sentiment_analyzer_init_success(mock_model, mock_tokenizer):
@@ -102,6 +179,111 @@ def test_indonesian_sentiment_analyzer_init_success(mock_model, mock_tokenizer):
     assert analyzer.tokenizer is not None
 
 
+@patch('transformers.AutoTokenizer')
+@patch('transformers.AutoModelForSequenceClassification')
+def test_indonesian_sentiment_analyzer_prefers_quantized_model(mock_model, mock_tokenizer, tmp_path):
+    """Test the INT8 ONNX model is used when it has been exported."""
+    (tmp_path / "model_quantized.onnx").touch()
+    mock_onnxruntime = Mock()
+    
+    with patch('emas_scraper.sentiment_analyzer.QUANTIZED_MODEL_DIR', tmp_path), \
+         patch.dict(sys.modules, {'optimum': Mock(), 'optimum.onnxruntime': mock_onnxruntime}):
+        analyzer = IndonesianSentimentAnalyzer()
+    
+    ort_model_class = mock_onnxruntime.ORTModelForSequenceClassification
+    assert analyzer.model_loaded is True
+    assert analyzer.model is ort_model_class.from_pretrained.return_value
+    ort_model_class.from_pretrained.assert_called_once_with(
+        tmp_path, file_name="model_quantized.onnx", provider="CPUExecutionProvider"
+    )
+    mock_model.from_pretrained.assert_not_called()
+
+
+@patch('transformers.AutoTokenizer')
+@patch('transformers.AutoModelForSequenceClassification')
+def test_indonesian_sentiment_analyzer_uses_cuda_fp16(mock_model, mock_tokenizer):
+    """Test the model moves to the GPU in half precision when CUDA is available."""
+    class FakeModule:
+        def half(self):
+            pass
+        
+        def to(self, device):
+            pass
+    
+    mock_torch = Mock()
+    mock_torch.nn.Module = FakeModule
+    mock_torch.cuda.is_available.return_value = True
+    eager_model = Mock(spec=FakeModule)
+    mock_model.from_pretrained.return_value = eager_model
+    
+    with patch.dict(sys.modules, {'torch': mock_torch}):
+        analyzer = IndonesianSentimentAnalyzer()
+    
+    assert analyzer.device == "cuda"
+    assert analyzer.model is eager_model.half.return_value.to.return_value
+    eager_model.half.return_value.to.assert_called_once_with("cuda")
+
+
+@patch('transformers.AutoTokenizer')
+@patch('transformers.AutoModelForSequenceClassification')
+def test_indonesian_sentiment_analyzer_torchscript_fallback(mock_model, mock_tokenizer):
+    """Test the eager model is kept when TorchScript tracing fails."""
+    analyzer = IndonesianSentimentAnalyzer(use_torchscript=True)
+    
+    assert analyzer.model_loaded is True
+    assert analyzer.model is mock_model.from_pretrained.return_value
+    mock_model.from_pretrained.assert_called_once_with(
+        "ayameRushia/bert-base-indonesian-1.5G-sentiment-analysis-smsa", torchscript=True
+    )
+
+
+@patch.object(IndonesianSentimentAnalyzer, '_load_model')
+def test_traced_model_inputs_are_padded_to_traced_length(mock_load_model):
+    """Test a TorchScript model gets inputs of its traced length, the eager model the longest text's."""
+    analyzer = IndonesianSentimentAnalyzer()
+    analyzer.tokenizer = Mock()
+    
+    analyzer.model = TracedClassifier(Mock(), batch_size=32, max_length=128)
+    analyzer._tokenize(["EMAS naik"])
+    analyzer.tokenizer.assert_called_with(
+        ["EMAS naik"], return_tensors="pt", padding="max_length", max_length=128, truncation=True
+    )
+    
+    analyzer.model = Mock()
+    analyzer._tokenize(["EMAS naik"])
+    analyzer.tokenizer.assert_called_with(
+        ["EMAS naik"], return_tensors="pt", padding=True, truncation=True, max_length=512
+    )
+
+
+def test_traced_model_runs_long_inputs_and_partial_batches(tmp_path):
+    """Test a real traced model handles texts longer than the trace and a partial last batch."""
+    torch = pytest.importorskip("torch")
+    from transformers import BertConfig, BertForSequenceClassification, BertTokenizerFast
+    
+    vocab = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", "emas", "naik", "turun", "saham"]
+    vocab_file = tmp_path / "vocab.txt"
+    vocab_file.write_text("\n".join(vocab), encoding='utf-8')
+    tokenizer = BertTokenizerFast(vocab_file=str(vocab_file))
+    
+    torch.manual_seed(0)
+    config = BertConfig(vocab_size=len(vocab), hidden_size=32, num_hidden_layers=1, num_attention_heads=2,
+                        intermediate_size=37, num_labels=3, torchscript=True)
+    model = BertForSequenceClassification(config).eval()
+    
+    with patch('transformers.AutoTokenizer.from_pretrained', return_value=tokenizer), \
+            patch('transformers.AutoModelForSequenceClassification.from_pretrained', return_value=model), \
+            patch('emas_scraper.sentiment_analyzer.QUANTIZED_MODEL_DIR', tmp_path):
+        analyzer = IndonesianSentimentAnalyzer(use_stock_enhancement=False, use_torchscript=True)
+    assert isinstance(analyzer.model, TracedClassifier)
+    
+    texts = [f"saham emas naik {i}" for i in range(40)] + [" ".join(["emas turun"] * 300)]
+    results = analyzer.analyze_batch(texts)
+    
+    assert len(results) == len(texts)
+    assert all(method == "indonesian_bert" for _, method, _ in results)
+
+
 @patch('transformers.AutoTokenizer')
 def test_indonesian_sentiment_analyzer_init_failure(mock_tokenizer):
     """Test fallback when Indonesian BERT fails to load."""
@@ -131,6 +313,96 @@ def test_indonesian_sentiment_analyzer_textblob_fallback():
             assert sentiment.score == 0.7
 
 
+@patch.object(IndonesianSentimentAnalyzer, '_load_model')
+def test_analyze_text_caches_repeated_text(mock_load_model):
+    """Test repeated texts are analyzed once per analyzer."""
+    analyzer = IndonesianSentimentAnalyzer(use_stock_enhancement=False)
+    result = (SentimentResult("positive", 0.8, "high"), "textblob_fallback")
+    
+    with patch.object(analyzer, '_analyze_with_textblob', return_value=result) as mock_textblob:
+        first = analyzer.analyze_text("EMAS naik")
+        second = analyzer.analyze_text("EMAS naik")
+    
+    mock_textblob.assert_called_once_with("EMAS naik")
+    assert first == second == (result[0], result[1], None)
+
+
+@patch.object(IndonesianSentimentAnalyzer, '_load_model')
+def test_analyze_batch_dedupes_and_keeps_order(mock_load_model):
+    """Test batch analysis runs each distinct text once and returns input order."""
+    analyzer = IndonesianSentimentAnalyzer(use_stock_enhancement=False)
+    analyzer.model_loaded = True
+    analyzer.model = Mock()
+    
+    def fake_bert(texts, batch_size):
+        return [(SentimentResult("positive" if "naik" in t else "negative", 0.9, "high"), "indonesian_bert")
+                for t in texts]
+    
+    with patch.object(analyzer, '_analyze_batch_with_bert', side_effect=fake_bert) as mock_bert:
+        results = analyzer.analyze_batch(["EMAS naik", "EMAS turun", "EMAS naik"])
+    
+    mock_bert.assert_called_once_with(["EMAS naik", "EMAS turun"], 32)
+    assert [sentiment.label for sentiment, _, _ in results] == ["positive", "negative", "positive"]
+    assert all(method == "indonesian_bert" for _, method, _ in results)
+
+
+@patch.object(IndonesianSentimentAnalyzer, '_load_model')
+def test_analyze_batch_shares_cache_with_analyze_text(mock_load_model):
+    """Test batches reuse earlier analyses and cached results cannot be mutated."""
+    analyzer = IndonesianSentimentAnalyzer()
+    result = (SentimentResult("positive", 0.8, "high"), "textblob_fallback")
+    
+    with patch.object(analyzer, '_analyze_with_textblob', return_value=result) as mock_textblob, \
+            patch.object(analyzer, '_analyze_batch_with_textblob',
+                         side_effect=lambda texts: [result] * len(texts)) as mock_batch:
+        single = analyzer.analyze_text("EMAS naik, akumulasi")
+        batch = analyzer.analyze_batch(["EMAS naik, akumulasi", "EMAS breakout"])
+        again = analyzer.analyze_batch(["EMAS breakout"])
+    
+    mock_textblob.assert_called_once_with("EMAS naik, akumulasi")
+    mock_batch.assert_called_once_with(["EMAS breakout"])
+    assert batch[0] is single
+    assert again[0] is batch[1]
+    
+    enhanced = single[2]
+    assert isinstance(enhanced.stock_terms_found, tuple)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        enhanced.stock_terms_found = ()
+
+
+@patch.object(IndonesianSentimentAnalyzer, '_load_model')
+def test_analyze_batch_textblob_uses_process_pool(mock_load_model):
+    """Test the TextBlob fallback spreads larger batches over a process pool."""
+    analyzer = IndonesianSentimentAnalyzer(use_stock_enhancement=False)
+    texts = [f"komentar {i}" for i in range(64)]
+    neutral = (SentimentResult("neutral", 0.0, "low"), "textblob_fallback")
+    
+    with patch('emas_scraper.sentiment_analyzer.ProcessPoolExecutor') as mock_pool_class, \
+            patch('emas_scraper.sentiment_analyzer.os.cpu_count', return_value=32):
+        mock_executor = mock_pool_class.return_value
+        mock_executor.map.side_effect = lambda fn, batch, chunksize: iter([neutral] * len(batch))
+        
+        results = analyzer.analyze_batch(texts)
+        analyzer.analyze_batch([f"lainnya {i}" for i in range(64)])
+        analyzer.close()
+    
+    # One capped pool serves every batch until the analyzer is closed
+    mock_pool_class.assert_called_once_with(max_workers=4)
+    assert mock_executor.map.call_count == 2
+    mock_executor.shutdown.assert_called_with(wait=False)
+    assert len(results) == 64
+    assert all(method == "textblob_fallback" for _, method, _ in results)
+
+
+@patch.object(IndonesianSentimentAnalyzer, '_load_model')
+def test_get_meaningful_words_skips_model_load(mock_load_model):
+    """Test word extraction cleans text without loading the model."""
+    words = get_meaningful_words("Saham $EMAS naik terus, cek https://example.com @trader")
+    
+    assert words == ["saham", "emas", "naik"]
+    mock_load_model.assert_not_called()
+
+
 def test_create_analysis_report():
     """Test creation of analysis report."""
     # Create test data
@@ -177,6 +449,32 @@ def test_create_analysis_report():
     assert detailed[2]["sentiment"]["label"] == "neutral"
 
 
+def test_write_analysis_report_matches_create_analysis_report(tmp_path):
+    """Test the streamed report holds the same content as the in-memory one."""
+    articles = [
+        NewsArticle("Berita \"positif\" ñ", "https://example1.com", "Source1", "2025-10-05"),
+        NewsArticle("Negative News", "https://example2.com", None, None)
+    ]
+    results = [
+        AnalysisResult(articles[0], SentimentResult("positive", 0.8123, "high"), "bert"),
+        AnalysisResult(articles[1], SentimentResult("negative", 0.5, "medium"), "textblob")
+    ]
+    output_path = tmp_path / "report.json"
+    
+    summary = write_analysis_report(iter(results), "test_file.json", output_path)
+    
+    with open(output_path, 'r', encoding='utf-8') as f:
+        written = json.load(f)
+    expected = create_analysis_report(results, "test_file.json")
+    for report in (written, expected, summary):
+        report["analysis_metadata"].pop("analysis_date")
+    
+    assert written == expected
+    assert list(written) == ["analysis_metadata", "sentiment_summary", "detailed_results"]
+    assert "detailed_results" not in summary
+    assert summary["sentiment_summary"] == expected["sentiment_summary"]
+
+
 def test_analyze_news_sentiment_integration():
     """Test the main analyze_news_sentiment function."""
     # Create test input file
@@ -200,10 +498,11 @@ def test_analyze_news_sentiment_integration():
         # Mock the sentiment analyzer to avoid loading actual models in tests
         with patch('emas_scraper.sentiment_analyzer.IndonesianSentimentAnalyzer') as mock_analyzer_class:
             mock_analyzer = Mock()
-            mock_analyzer.analyze_text.return_value = (
+            mock_analyzer.analyze_batch.return_value = [(
                 SentimentResult("positive", 0.8, "high"),
-                "mock_method"
-            )
+                "mock_method",
+                None
+            )]
             mock_analyzer_class.return_value = mock_analyzer
             
             success = analyze_news_sentiment(input_path, output_path)
@@ -227,6 +526,113 @@ def test_analyze_news_sentiment_integration():
             output_path.unlink()
 
 
+def test_analyze_news_sentiment_from_stream(tmp_path):
+    """Test analyze_news_sentiment reads a binary stream without an input file."""
+    input_stream = BytesIO(json.dumps([
+        {"title": "Great news for investors", "url": "https://example.com"}
+    ]).encode('utf-8'))
+    output_path = tmp_path / "report.json"
+    
+    with patch('emas_scraper.sentiment_analyzer.IndonesianSentimentAnalyzer') as mock_analyzer_class:
+        mock_analyzer_class.return_value.analyze_batch.return_value = [
+            (SentimentResult("positive", 0.8, "high"), "mock_method", None)
+        ]
+        assert analyze_news_sentiment(input_stream, output_path) is True
+    
+    result_data = json.loads(output_path.read_text(encoding='utf-8'))
+    assert result_data["analysis_metadata"]["source_file"] == "<stream>"
+    assert result_data["detailed_results"][0]["sentiment"]["label"] == "positive"
+
+
+def test_write_analysis_report_empty(tmp_path):
+    """Test a report with no results is still valid JSON."""
+    output_path = tmp_path / "report.json"
+    write_analysis_report(iter([]), "test_file.json", output_path)
+    
+    written = json.loads(output_path.read_text(encoding='utf-8'))
+    assert written["detailed_results"] == []
+    assert written["analysis_metadata"]["total_articles"] == 0
+
+
+def test_iter_sentiment_results_analyzes_in_chunks():
+    """Test results are produced one analyze_batch call per chunk, in article order."""
+    articles = [NewsArticle(f"Berita {i}", f"https://example.com/{i}", None, None) for i in range(5)]
+    
+    with patch('emas_scraper.sentiment_analyzer.IndonesianSentimentAnalyzer') as mock_analyzer_class:
+        mock_analyzer = mock_analyzer_class.return_value
+        mock_analyzer.analyze_batch.side_effect = lambda texts: [
+            (SentimentResult("neutral", 0.0, "low"), "mock_method", None) for _ in texts
+        ]
+        results = iter_sentiment_results(iter(articles), chunk_size=2)
+        
+        first = next(results)
+        assert mock_analyzer.analyze_batch.call_count == 1
+        rest = list(results)
+    
+    assert [call.args[0] for call in mock_analyzer.analyze_batch.call_args_list] == [
+        ["Berita 0", "Berita 1"], ["Berita 2", "Berita 3"], ["Berita 4"]
+    ]
+    assert [r.article for r in [first] + rest] == articles
+
+
+def test_scrape_and_analyze(tmp_path):
+    """Test search results are analyzed in memory or streamed into a report."""
+    from emas_scraper.config import SearchConfig
+    from emas_scraper.google_news import NewsItem
+    
+    items = [NewsItem("Harga emas naik", "https://example.com/1", "Kontan", "2025-10-05")]
+    cfg = SearchConfig(keywords=["EMAS"])
+    output_path = tmp_path / "report.json"
+    
+    with patch('emas_scraper.google_news.search_google_news', return_value=items), \
+            patch('emas_scraper.sentiment_analyzer.IndonesianSentimentAnalyzer') as mock_analyzer_class:
+        mock_analyzer_class.return_value.analyze_batch.return_value = [
+            (SentimentResult("positive", 0.8, "high"), "mock_method", None)
+        ]
+        results = scrape_and_analyze(cfg)
+        assert not output_path.exists()
+        
+        assert scrape_and_report(cfg, output_path) is True
+    
+    assert len(results) == 1
+    assert results[0].article.title == "Harga emas naik"
+    assert results[0].article.source == "Kontan"
+    assert results[0].method == "mock_method"
+    
+    result_data = json.loads(output_path.read_text(encoding='utf-8'))
+    assert result_data["analysis_metadata"]["source_file"] == f"google_news:{cfg.query}"
+
+
+def test_analyzer_is_shared_across_calls():
+    """Test repeated pipeline runs reuse one analyzer instead of reloading the model."""
+    articles = [NewsArticle("Harga emas naik", "https://example.com", None, None)]
+    
+    with patch('emas_scraper.sentiment_analyzer.IndonesianSentimentAnalyzer') as mock_analyzer_class:
+        mock_analyzer_class.return_value.analyze_batch.return_value = [
+            (SentimentResult("positive", 0.8, "high"), "mock_method", None)
+        ]
+        analyze_sentiment_batch(articles)
+        analyze_sentiment_batch(articles)
+    
+    mock_analyzer_class.assert_called_once_with()
+    assert mock_analyzer_class.return_value.analyze_batch.call_count == 2
+
+
+def test_analyzer_with_failed_model_load_is_not_shared():
+    """Test a failed BERT load is retried on the next call instead of being cached."""
+    articles = [NewsArticle("Harga emas naik", "https://example.com", None, None)]
+    
+    with patch('emas_scraper.sentiment_analyzer.IndonesianSentimentAnalyzer') as mock_analyzer_class:
+        mock_analyzer_class.return_value.model_loaded = False
+        mock_analyzer_class.return_value.analyze_batch.return_value = [
+            (SentimentResult("neutral", 0.0, "low"), "textblob_fallback", None)
+        ]
+        analyze_sentiment_batch(articles)
+        analyze_sentiment_batch(articles)
+    
+    assert mock_analyzer_class.call_count == 2
+
+
 def test_analyze_news_sentiment_no_input_file():
     """Test analyze_news_sentiment with non-existent input file."""
     input_path = Path("non_existent.json")